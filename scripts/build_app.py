@@ -10,6 +10,7 @@ Usage:
 """
 
 import argparse
+import hashlib
 import os
 import platform
 import plistlib
@@ -17,6 +18,7 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 # ---------------------------------------------------------------------------
 # Config
@@ -28,11 +30,54 @@ VERSION = "0.1.0"
 PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DIST_DIR = os.path.join(PROJECT_DIR, "dist")
 APP_PATH = os.path.join(DIST_DIR, f"{APP_NAME}.app")
+CACHE_DIR = os.path.join(os.path.expanduser("~"), "Library", "Caches", APP_NAME)
+
+
+# ---------------------------------------------------------------------------
+# File copy helpers
+# ---------------------------------------------------------------------------
+def _clonetree(src: str, dst: str, ignore_pycache: bool = False) -> None:
+    """Copy a directory tree using APFS clonefile (copy-on-write).
+
+    `cp -c` clones instead of copying bytes, so the copy is effectively
+    metadata-only. Falls back to shutil.copytree when cloning fails
+    (e.g. non-APFS or cross-volume destination).
+    """
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    result = subprocess.run(
+        ["cp", "-cR", src, dst], capture_output=True, check=False,
+    )
+    if result.returncode != 0:
+        shutil.rmtree(dst, ignore_errors=True)
+        ignore = shutil.ignore_patterns("__pycache__") if ignore_pycache else None
+        shutil.copytree(src, dst, symlinks=True, ignore=ignore)
+        return
+
+    if ignore_pycache:
+        for root, dirs, _files in os.walk(dst):
+            if "__pycache__" in dirs:
+                shutil.rmtree(os.path.join(root, "__pycache__"))
+                dirs.remove("__pycache__")
 
 
 # ---------------------------------------------------------------------------
 # Icon generation (using AppKit)
 # ---------------------------------------------------------------------------
+# (filename, pixel size) pairs making up the .iconset
+_ICON_ENTRIES = (
+    ("icon_16x16.png", 16),
+    ("icon_16x16@2x.png", 32),
+    ("icon_32x32.png", 32),
+    ("icon_32x32@2x.png", 64),
+    ("icon_128x128.png", 128),
+    ("icon_128x128@2x.png", 256),
+    ("icon_256x256.png", 256),
+    ("icon_256x256@2x.png", 512),
+    ("icon_512x512.png", 512),
+    ("icon_512x512@2x.png", 1024),
+)
+
+
 def generate_icon(output_icns: str) -> None:
     """Generate a simple app icon."""
     try:
@@ -43,80 +88,122 @@ def generate_icon(output_icns: str) -> None:
 
 def _generate_icon_appkit(output_icns: str) -> None:
     """Generate icon using AppKit (requires pyobjc)."""
+    from AppKit import NSPNGFileType
+
+    iconset_dir = os.path.join(DIST_DIR, f"{APP_NAME}.iconset")
+    # Start clean: a crashed earlier build may have left links behind
+    shutil.rmtree(iconset_dir, ignore_errors=True)
+    os.makedirs(iconset_dir)
+
+    # Several entries share a pixel size (e.g. 32x32 and 16x16@2x); render
+    # each size once and hardlink the rest.
+    size_to_files: dict[int, list[str]] = {}
+    for filename, size in _ICON_ENTRIES:
+        size_to_files.setdefault(size, []).append(filename)
+
+    # Draw the artwork once at the largest size; smaller sizes are
+    # downscaled from it, which is far cheaper than redrawing paths + text.
+    master_size = max(size_to_files)
+    master = _render_icon_master(master_size)
+
+    for size, files in size_to_files.items():
+        rep = master if size == master_size else _scale_bitmap(master, size)
+        png = rep.representationUsingType_properties_(NSPNGFileType, {})
+        canonical = os.path.join(iconset_dir, files[0])
+        png.writeToFile_atomically_(canonical, False)  # scratch file for iconutil
+        for extra in files[1:]:
+            os.link(canonical, os.path.join(iconset_dir, extra))
+
+    subprocess.run(
+        ["iconutil", "-c", "icns", iconset_dir, "-o", output_icns],
+        check=True,
+    )
+    shutil.rmtree(iconset_dir)
+    print(f"  Icon: {output_icns}")
+
+
+def _new_bitmap(size: int):
+    """Create an empty size x size RGBA NSBitmapImageRep."""
+    from AppKit import NSBitmapImageRep, NSDeviceRGBColorSpace
+
+    return NSBitmapImageRep.alloc().initWithBitmapDataPlanes_pixelsWide_pixelsHigh_bitsPerSample_samplesPerPixel_hasAlpha_isPlanar_colorSpaceName_bytesPerRow_bitsPerPixel_(
+        None, size, size, 8, 4, True, False, NSDeviceRGBColorSpace, 0, 32,
+    )
+
+
+def _render_icon_master(size: int):
+    """Draw the icon artwork into a size x size bitmap."""
     from AppKit import (
         NSBezierPath,
-        NSBitmapImageRep,
         NSColor,
         NSFont,
         NSFontAttributeName,
         NSForegroundColorAttributeName,
-        NSImage,
+        NSGraphicsContext,
         NSMakeRect,
-        NSPNGFileType,
     )
     from Foundation import NSAttributedString, NSDictionary
 
-    iconset_dir = os.path.join(DIST_DIR, f"{APP_NAME}.iconset")
-    os.makedirs(iconset_dir, exist_ok=True)
-
-    entries = {
-        "icon_16x16.png": 16,
-        "icon_16x16@2x.png": 32,
-        "icon_32x32.png": 32,
-        "icon_32x32@2x.png": 64,
-        "icon_128x128.png": 128,
-        "icon_128x128@2x.png": 256,
-        "icon_256x256.png": 256,
-        "icon_256x256@2x.png": 512,
-        "icon_512x512.png": 512,
-        "icon_512x512@2x.png": 1024,
-    }
+    # Draw straight into a bitmap (no NSImage -> TIFF -> bitmap round-trip)
+    rep = _new_bitmap(size)
+    NSGraphicsContext.saveGraphicsState()
+    NSGraphicsContext.setCurrentContext_(
+        NSGraphicsContext.graphicsContextWithBitmapImageRep_(rep)
+    )
 
-    for filename, size in entries.items():
-        img = NSImage.alloc().initWithSize_((size, size))
-        img.lockFocus()
-
-        # Background: rounded rectangle
-        bg = NSColor.colorWithRed_green_blue_alpha_(0.28, 0.15, 0.70, 1.0)
-        bg.setFill()
-        radius = size * 0.22
-        NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
-            NSMakeRect(0, 0, size, size), radius, radius
-        ).fill()
-
-        # Inner glow
-        inner = NSColor.colorWithRed_green_blue_alpha_(0.45, 0.30, 0.90, 0.3)
-        inner.setFill()
-        inset = size * 0.08
-        NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
-            NSMakeRect(inset, inset, size - inset * 2, size - inset * 2),
-            radius * 0.8,
-            radius * 0.8,
-        ).fill()
-
-        # "VB" text
-        font_size = size * 0.38
-        attrs = NSDictionary.dictionaryWithDictionary_({
-            NSFontAttributeName: NSFont.boldSystemFontOfSize_(font_size),
-            NSForegroundColorAttributeName: NSColor.whiteColor(),
-        })
-        text = NSAttributedString.alloc().initWithString_attributes_("VB", attrs)
-        ts = text.size()
-        text.drawAtPoint_(((size - ts.width) / 2, (size - ts.height) / 2))
-
-        img.unlockFocus()
-
-        tiff = img.TIFFRepresentation()
-        bitmap = NSBitmapImageRep.imageRepWithData_(tiff)
-        png = bitmap.representationUsingType_properties_(NSPNGFileType, {})
-        png.writeToFile_atomically_(os.path.join(iconset_dir, filename), True)
+    # Background: rounded rectangle
+    bg = NSColor.colorWithRed_green_blue_alpha_(0.28, 0.15, 0.70, 1.0)
+    bg.setFill()
+    radius = size * 0.22
+    NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
+        NSMakeRect(0, 0, size, size), radius, radius
+    ).fill()
+
+    # Inner glow
+    inner = NSColor.colorWithRed_green_blue_alpha_(0.45, 0.30, 0.90, 0.3)
+    inner.setFill()
+    inset = size * 0.08
+    NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
+        NSMakeRect(inset, inset, size - inset * 2, size - inset * 2),
+        radius * 0.8,
+        radius * 0.8,
+    ).fill()
+
+    # "VB" text
+    font_size = size * 0.38
+    attrs = NSDictionary.dictionaryWithDictionary_({
+        NSFontAttributeName: NSFont.boldSystemFontOfSize_(font_size),
+        NSForegroundColorAttributeName: NSColor.whiteColor(),
+    })
+    text = NSAttributedString.alloc().initWithString_attributes_("VB", attrs)
+    ts = text.size()
+    text.drawAtPoint_(((size - ts.width) / 2, (size - ts.height) / 2))
+
+    NSGraphicsContext.restoreGraphicsState()
+    return rep
+
+
+def _scale_bitmap(master, size: int):
+    """Downscale `master` into a new size x size bitmap (high-quality)."""
+    from AppKit import (
+        NSCompositingOperationCopy,
+        NSGraphicsContext,
+        NSImageInterpolationHigh,
+        NSMakeRect,
+        NSZeroRect,
+    )
 
-    subprocess.run(
-        ["iconutil", "-c", "icns", iconset_dir, "-o", output_icns],
-        check=True,
+    rep = _new_bitmap(size)
+    NSGraphicsContext.saveGraphicsState()
+    ctx = NSGraphicsContext.graphicsContextWithBitmapImageRep_(rep)
+    NSGraphicsContext.setCurrentContext_(ctx)
+    ctx.setImageInterpolation_(NSImageInterpolationHigh)
+    master.drawInRect_fromRect_operation_fraction_respectFlipped_hints_(
+        NSMakeRect(0, 0, size, size), NSZeroRect,
+        NSCompositingOperationCopy, 1.0, False, None,
     )
-    shutil.rmtree(iconset_dir)
-    print(f"  Icon: {output_icns}")
+    NSGraphicsContext.restoreGraphicsState()
+    return rep
 
 
 # ---------------------------------------------------------------------------
@@ -299,41 +386,80 @@ int main(int argc, char *argv[]) {
         setProgramName(w_prog);
     }
 
-    /* --- Run: python -m voxbridge --preload --- */
+    /* --- Run: python -s -m voxbridge --preload ---
+     * -s: skip the per-user site-packages dir (an extra sys.path entry
+     * every import would probe; the bundle carries its own venv) */
     wchar_t *py_argv[] = {
         L"voxbridge",
+        L"-s",
         L"-m", L"voxbridge",
         L"--preload",
     };
-    return pyMain(4, py_argv);
+    return pyMain(5, py_argv);
 }
 """
 
 
 def _compile_launcher(output_path: str, python_version: str) -> None:
-    """Compile a self-contained Mach-O launcher (only Python version baked in)."""
+    """Compile a self-contained Mach-O launcher (only Python version baked in).
+
+    The binary only depends on the C source, the compiler flags and the
+    target arch, so it is cached under CACHE_DIR and reused across builds.
+    """
     src = _LAUNCHER_C_TEMPLATE.replace("@@PYTHON_VERSION@@", python_version)
+    arch = platform.machine()  # "arm64" or "x86_64"
+    cflags = [
+        "-arch", arch, "-O2", "-flto", "-fvisibility=hidden",
+        "-Wl,-dead_strip",
+        "-Wl,-rpath,@executable_path/../Frameworks",
+    ]
+
+    key = hashlib.sha256("\0".join([src, *cflags]).encode()).hexdigest()
+    cached = os.path.join(CACHE_DIR, f"launcher-{key[:16]}")
+    if os.path.isfile(cached):
+        shutil.copy2(cached, output_path)
+        os.chmod(output_path, 0o755)
+        return
 
     with tempfile.NamedTemporaryFile(suffix=".c", mode="w", delete=False) as f:
         f.write(src)
         c_path = f.name
     try:
-        arch = platform.machine()  # "arm64" or "x86_64"
         subprocess.run(
-            [
-                "clang", "-arch", arch, "-O2",
-                "-Wl,-rpath,@executable_path/../Frameworks",
-                "-o", output_path, c_path,
-            ],
+            ["clang", *cflags, "-o", output_path, c_path],
             check=True,
         )
     finally:
         os.unlink(c_path)
 
+    # Populate the cache via a temp file in the same directory so an
+    # interrupted or concurrent build never leaves a truncated launcher
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix=".launcher-")
+    os.close(fd)
+    try:
+        shutil.copy2(output_path, tmp)
+        os.replace(tmp, cached)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
 
 # ---------------------------------------------------------------------------
 # Fix dylib references for portability
 # ---------------------------------------------------------------------------
+# Directories that never hold Mach-O files needed at runtime
+_PRUNE_DIRS = frozenset({"__pycache__", "tests", "test", "docs"})
+
+
+def _prune_walk_dirs(dirs: list[str]) -> None:
+    """Drop uninteresting subdirectories from an os.walk() `dirs` list in place."""
+    dirs[:] = [
+        d for d in dirs
+        if d not in _PRUNE_DIRS and not d.endswith((".dist-info", ".egg-info"))
+    ]
+
+
 def _collect_dylib_id_map(frameworks_dir: str, python_version: str) -> dict:
     """Scan bundled framework dylibs and build {old_install_name: (new_name, path)} map."""
     rpath_prefix = f"@rpath/Python.framework/Versions/{python_version}"
@@ -398,33 +524,165 @@ def _fix_dylib_paths(
 
     # Fix all .so and .dylib references throughout the bundle
     fixed_reals = {os.path.realpath(fpath) for _, (_, fpath) in id_map.items()}
-    for root, _dirs, files in os.walk(app_contents):
+    targets: list[str] = []
+    for root, dirs, files in os.walk(app_contents, followlinks=False):
+        _prune_walk_dirs(dirs)
         for fname in files:
             if not fname.endswith((".so", ".dylib")) and fname != "Python":
                 continue
             fpath = os.path.join(root, fname)
             if os.path.islink(fpath):
                 continue
-            if os.path.realpath(fpath) in fixed_reals:
-                # Also fix cross-references between framework dylibs
-                for old_id, (new_id, _) in id_map.items():
-                    subprocess.run(
-                        ["install_name_tool", "-change", old_id, new_id, fpath],
-                        capture_output=True, check=False,
-                    )
-                continue
-            # Update all known references
-            for old_id, (new_id, _) in id_map.items():
-                subprocess.run(
-                    ["install_name_tool", "-change", old_id, new_id, fpath],
-                    capture_output=True, check=False,
-                )
-            # Add rpath so @rpath references can resolve
+            targets.append(fpath)
+
+    # Update all known references (for framework dylibs this fixes
+    # cross-references between them) in a single install_name_tool call
+    change_args: list[str] = []
+    for old_id, (new_id, _) in id_map.items():
+        change_args += ["-change", old_id, new_id]
+
+    def _fix_one(fpath: str) -> None:
+        if os.path.realpath(fpath) in fixed_reals:
+            subprocess.run(
+                ["install_name_tool", *change_args, fpath],
+                capture_output=True, check=False,
+            )
+            return
+        # Add rpath so @rpath references can resolve
+        result = subprocess.run(
+            ["install_name_tool", *change_args, "-add_rpath", rpath, fpath],
+            capture_output=True, check=False,
+        )
+        if result.returncode != 0:
+            # -add_rpath fails the whole call if the rpath already exists;
+            # retry so the -change operations still apply
             subprocess.run(
-                ["install_name_tool", "-add_rpath", rpath, fpath],
+                ["install_name_tool", *change_args, fpath],
                 capture_output=True, check=False,
             )
 
+    # Only files that actually link against a relocated dylib need fixing
+    # (most extension modules resolve Python symbols dynamically)
+    referencing = _files_referencing(targets, set(id_map))
+    targets = [fpath for fpath in targets if fpath in referencing]
+
+    # install_name_tool is fork/exec bound; overlap the calls across files
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        list(ex.map(_fix_one, targets))
+
+
+def _files_referencing(paths: list[str], names: set[str]) -> set[str]:
+    """Return the subset of `paths` whose load commands reference any of `names`.
+
+    Runs `otool -L` in batches (it accepts many files per call) instead of
+    once per file, and only once per inode so hardlinked copies share a scan.
+    """
+    by_inode: dict[tuple[int, int], list[str]] = {}
+    for fpath in paths:
+        st = os.stat(fpath)
+        by_inode.setdefault((st.st_dev, st.st_ino), []).append(fpath)
+    unique = [group[0] for group in by_inode.values()]
+
+    batch_size = 200
+    batches = [unique[i:i + batch_size] for i in range(0, len(unique), batch_size)]
+
+    def _scan(batch: list[str]) -> set[str]:
+        result = subprocess.run(
+            ["otool", "-L", *batch],
+            capture_output=True, text=True, check=False,
+        )
+        found: set[str] = set()
+        current = None
+        for line in result.stdout.splitlines():
+            if not line[:1].isspace():
+                # Header: "<path>:" or "<path> (architecture arm64):"
+                current = line.rstrip(":").split(" (architecture ")[0]
+                continue
+            ref = line.strip().split(" (compatibility version")[0]
+            if current is not None and ref in names:
+                found.add(current)
+        return found
+
+    scanned: set[str] = set()
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for found in ex.map(_scan, batches):
+            scanned |= found
+    return {
+        fpath
+        for group in by_inode.values() if group[0] in scanned
+        for fpath in group
+    }
+
+
+# ---------------------------------------------------------------------------
+# Venv (cached by requirements.txt hash)
+# ---------------------------------------------------------------------------
+def _venv_cache_path(req: str, python_version: str) -> str:
+    """Return the cache directory for a venv built from `req`."""
+    h = hashlib.sha256()
+    with open(req, "rb") as f:
+        h.update(f.read())
+    h.update(f"{python_version}:{platform.machine()}".encode())
+    return os.path.join(CACHE_DIR, f"venv-{h.hexdigest()[:16]}")
+
+
+def _prepare_venv(venv_dir: str, base_python: str, python_version: str) -> None:
+    """Create the bundled venv, reusing a cached copy when requirements match.
+
+    The cache holds the venv as it was right after `pip install`, before
+    any dylib fixups, so a restored copy goes through the same post-processing.
+    """
+    req = os.path.join(PROJECT_DIR, "requirements.txt")
+    cache = _venv_cache_path(req, python_version)
+    if os.path.isdir(cache):
+        print(f"  Restoring venv from cache: {cache}")
+        _clonetree(cache, venv_dir)
+        return
+
+    print(f"  Creating venv: {venv_dir}")
+    subprocess.run([base_python, "-m", "venv", venv_dir], check=True)
+
+    print(f"  Installing dependencies (this may take a minute) ...")
+    uv = shutil.which("uv")
+    if uv:
+        # uv resolves/installs in parallel and clones wheels from its cache
+        subprocess.run(
+            [
+                uv, "pip", "install", "-q",
+                "--python", os.path.join(venv_dir, "bin", "python"),
+                "--link-mode=clone",
+                "-r", req,
+            ],
+            check=True,
+        )
+    else:
+        _pip_install_from_wheel_cache(os.path.join(venv_dir, "bin", "pip"), req)
+    print(f"  Dependencies installed.")
+
+    # Populate the cache via a temp dir so an interrupted copy is never reused
+    tmp = f"{cache}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    _clonetree(venv_dir, tmp)
+    os.replace(tmp, cache)
+    print(f"  Venv cached: {cache}")
+
+
+def _pip_install_from_wheel_cache(pip: str, req: str) -> None:
+    """Install requirements offline from a local wheel cache.
+
+    The cache is (re)filled with `pip wheel` only when the offline install
+    cannot be satisfied, so repeat builds skip PyPI lookups entirely.
+    """
+    wheel_dir = os.path.join(CACHE_DIR, "wheels")
+    offline = [
+        pip, "install", "-q", "--no-index", "--find-links", wheel_dir, "-r", req,
+    ]
+    if os.path.isdir(wheel_dir):
+        if subprocess.run(offline, capture_output=True, check=False).returncode == 0:
+            return
+    subprocess.run([pip, "wheel", "-q", "-r", req, "-w", wheel_dir], check=True)
+    subprocess.run(offline, check=True)
+
 
 # ---------------------------------------------------------------------------
 # Build .app bundle
@@ -442,68 +700,77 @@ def build_app(version: str = VERSION) -> str:
     os.makedirs(resources)
     os.makedirs(frameworks)
 
-    # --- Detect Python info ---
-    py_info = _detect_python_info()
-    python_version = py_info["version"]
-    print(f"  Python version: {python_version}")
-    print(f"  Python framework: {py_info['framework_src']}")
-
-    # --- Copy Python.framework ---
-    print(f"  Copying Python.framework ...")
-    fw_version_src = os.path.join(
-        py_info["framework_src"], "Versions", python_version,
-    )
-    fw_dest = os.path.join(frameworks, "Python.framework")
-    fw_version_dest = os.path.join(fw_dest, "Versions", python_version)
-    shutil.copytree(fw_version_src, fw_version_dest, symlinks=True)
-    # Create standard framework symlinks
-    os.symlink(python_version, os.path.join(fw_dest, "Versions", "Current"))
-    os.symlink(
-        f"Versions/Current/Python", os.path.join(fw_dest, "Python"),
-    )
-    print(f"  Python.framework -> {fw_dest}")
-
-    # --- Copy source code, config, prompts ---
-    print(f"  Copying source code ...")
-    shutil.copytree(
-        os.path.join(PROJECT_DIR, "voxbridge"),
-        os.path.join(resources, "voxbridge"),
-        ignore=shutil.ignore_patterns("__pycache__"),
-    )
-    shutil.copy2(
-        os.path.join(PROJECT_DIR, "config.yaml"),
-        os.path.join(resources, "config.yaml"),
-    )
-    shutil.copytree(
-        os.path.join(PROJECT_DIR, "prompts"),
-        os.path.join(resources, "prompts"),
-    )
+    # --- Icon ---
+    # Icon generation is CPU-bound and shares nothing with the copy/venv
+    # steps below, so it runs on a background thread while they proceed.
+    # The with-block joins that thread even if a later step fails.
+    with ThreadPoolExecutor(max_workers=1) as icon_executor:
+        icon_path = os.path.join(resources, "icon.icns")
+        prebuilt_icon = os.path.join(PROJECT_DIR, "resources", "icon.icns")
+        icon_future = None
+        if os.path.exists(prebuilt_icon):
+            shutil.copy2(prebuilt_icon, icon_path)
+            print(f"  Icon: {prebuilt_icon} (prebuilt)")
+        else:
+            icon_future = icon_executor.submit(generate_icon, icon_path)
+
+        # --- Detect Python info ---
+        py_info = _detect_python_info()
+        python_version = py_info["version"]
+        print(f"  Python version: {python_version}")
+        print(f"  Python framework: {py_info['framework_src']}")
+
+        # --- Copy Python.framework ---
+        print(f"  Copying Python.framework ...")
+        fw_version_src = os.path.join(
+            py_info["framework_src"], "Versions", python_version,
+        )
+        fw_dest = os.path.join(frameworks, "Python.framework")
+        fw_version_dest = os.path.join(fw_dest, "Versions", python_version)
+        _clonetree(fw_version_src, fw_version_dest)
+        # Create standard framework symlinks
+        os.symlink(python_version, os.path.join(fw_dest, "Versions", "Current"))
+        os.symlink(
+            f"Versions/Current/Python", os.path.join(fw_dest, "Python"),
+        )
+        print(f"  Python.framework -> {fw_dest}")
+
+        # --- Copy source code, config, prompts ---
+        print(f"  Copying source code ...")
+        _clonetree(
+            os.path.join(PROJECT_DIR, "voxbridge"),
+            os.path.join(resources, "voxbridge"),
+            ignore_pycache=True,
+        )
+        shutil.copy2(
+            os.path.join(PROJECT_DIR, "config.yaml"),
+            os.path.join(resources, "config.yaml"),
+        )
+        _clonetree(
+            os.path.join(PROJECT_DIR, "prompts"),
+            os.path.join(resources, "prompts"),
+        )
 
-    # --- Create venv and install dependencies ---
-    venv_dir = os.path.join(resources, "venv")
-    print(f"  Creating venv: {venv_dir}")
-    subprocess.run(
-        [py_info["base_python"], "-m", "venv", venv_dir],
-        check=True,
-    )
+        # Byte-compile so the first launch doesn't pay for it (and doesn't try
+        # to write __pycache__ into the signed bundle)
+        subprocess.run(
+            [
+                py_info["base_python"], "-m", "compileall", "-j", "0", "-q",
+                os.path.join(resources, "voxbridge"),
+            ],
+            check=False,
+        )
 
-    pip = os.path.join(venv_dir, "bin", "pip")
-    req = os.path.join(PROJECT_DIR, "requirements.txt")
-    print(f"  Installing dependencies (this may take a minute) ...")
-    subprocess.run([pip, "install", "-q", "-r", req], check=True)
-    print(f"  Dependencies installed.")
+        # --- Create venv and install dependencies ---
+        venv_dir = os.path.join(resources, "venv")
+        _prepare_venv(venv_dir, py_info["base_python"], python_version)
 
-    # --- Fix dylib paths for portability ---
-    _fix_dylib_paths(contents, python_version, py_info["dylib_install_name"])
+        # --- Fix dylib paths for portability ---
+        _fix_dylib_paths(contents, python_version, py_info["dylib_install_name"])
 
-    # --- Icon ---
-    icon_path = os.path.join(resources, "icon.icns")
-    prebuilt_icon = os.path.join(PROJECT_DIR, "resources", "icon.icns")
-    if os.path.exists(prebuilt_icon):
-        shutil.copy2(prebuilt_icon, icon_path)
-        print(f"  Icon: {prebuilt_icon} (prebuilt)")
-    else:
-        generate_icon(icon_path)
+        # --- Icon (finish generating in the background) ---
+        if icon_future is not None:
+            icon_future.result()
 
     # --- Info.plist ---
     plist = {
@@ -537,27 +804,31 @@ def build_app(version: str = VERSION) -> str:
     print(f"  Executable: {exec_path} (self-contained Mach-O)")
 
     # --- Code signing (ad-hoc) ---
-    # Sign individual Mach-O binaries first, then framework, then app
+    # Sign loose Mach-O binaries first (codesign --deep only descends into
+    # nested bundles, not .so/.dylib files under Resources/ or lib/), then
+    # let a single --deep pass sign the framework and the app.
+    # Batch binaries by path depth: one codesign call per depth, deepest first
     print(f"  Signing binaries ...")
-    for root, _dirs, files in os.walk(contents):
+    groups: dict[int, list[str]] = {}
+    for root, dirs, files in os.walk(contents, followlinks=False):
+        _prune_walk_dirs(dirs)
         for fname in files:
             if fname.endswith((".so", ".dylib")):
                 fpath = os.path.join(root, fname)
                 if os.path.islink(fpath):
                     continue
-                subprocess.run(
-                    ["codesign", "--force", "--sign", "-", fpath],
-                    capture_output=True, check=False,
-                )
-    # Sign the framework bundle
-    fw_path = os.path.join(frameworks, "Python.framework")
-    subprocess.run(
-        ["codesign", "--force", "--sign", "-", fw_path],
-        capture_output=True, check=False,
-    )
-    # Sign the app bundle
+                groups.setdefault(fpath.count(os.sep), []).append(fpath)
+    for depth in sorted(groups, reverse=True):
+        subprocess.run(
+            ["codesign", "--force", "--sign", "-", *groups[depth]],
+            capture_output=True, check=False,
+        )
+    # Sign Python.framework and the app bundle in one pass
     subprocess.run(
-        ["codesign", "--force", "--sign", "-", APP_PATH],
+        [
+            "codesign", "--force", "--deep", "--timestamp=none",
+            "--sign", "-", APP_PATH,
+        ],
         check=True,
     )
     print(f"  Signed: ad-hoc")
@@ -601,7 +872,9 @@ def main():
         dest = f"/Applications/{APP_NAME}.app"
         if os.path.exists(dest):
             shutil.rmtree(dest)
-        shutil.copytree(app_path, dest)
+        # ditto preserves symlinks, xattrs and ACLs (needed for the code
+        # signature) and clones files on APFS
+        subprocess.run(["ditto", "--nocache", app_path, dest], check=True)
         print(f"\n  Installed: {dest}")
 
     print(f"\nDone! Launch with:")
@@ -34,13 +34,14 @@ def test_recorder():
     print("  Recording 2 seconds... (speak now)")
     rec.start()
     time.sleep(2)
-    audio = rec.stop()
+    audio = rec.stop(trim_silence=False)
 
-    assert audio is not None, "No audio captured"
+    assert audio.size > 0, "No audio captured"
     assert audio.dtype == np.float32
     duration = len(audio) / 16000
     print(f"  Captured: {len(audio)} samples ({duration:.1f}s)")
-    print(f"  Peak amplitude: {np.abs(audio).max():.4f}")
+    peak = max(audio.max(), -audio.min())
+    print(f"  Peak amplitude: {peak:.4f}")
     print("  OK")
     return audio
 
@@ -94,7 +95,7 @@ def test_injector():
 
     injector = Injector({"send_enter_for": ["Terminal", "iTerm2"]})
     app_name = injector.get_active_app_name()
-    should_enter = injector._should_send_enter()
+    should_enter = injector._should_send_enter(app_name)
     print(f"  Active app: '{app_name}'")
     print(f"  Would send Enter: {should_enter}")
     print("  OK (no text injected)")
@@ -1,18 +1,38 @@
 """Main VoxBridge application - orchestrates all components."""
 
+import functools
 import hashlib
 import os
-import signal
+import queue
 import subprocess
 import threading
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from AppKit import NSApplication, NSApplicationActivationPolicyAccessory, NSEvent, NSBundle
 from ApplicationServices import AXIsProcessTrustedWithOptions
 from Foundation import NSObject
 from PyObjCTools import AppHelper
+from Quartz import (
+    CFMachPortCreateRunLoopSource,
+    CFRunLoopAddSource,
+    CFRunLoopGetMain,
+    CGEventGetFlags,
+    CGEventGetIntegerValueField,
+    CGEventMaskBit,
+    CGEventTapCreate,
+    CGEventTapEnable,
+    kCFRunLoopCommonModes,
+    kCGEventFlagsChanged,
+    kCGEventTapDisabledByTimeout,
+    kCGEventTapDisabledByUserInput,
+    kCGEventTapOptionListenOnly,
+    kCGHeadInsertEventTap,
+    kCGKeyboardEventKeycode,
+    kCGSessionEventTap,
+)
 import objc
 
 from .config import load_config
@@ -22,20 +42,20 @@ from .constants import (
     FORMAT_LEVEL_LABELS,
     HOTKEY_LABELS,
     KEY_ESCAPE,
-    MIN_AUDIO_SAMPLES,
-    MIN_PREVIEW_SAMPLES,
+    MIN_AUDIO_SEC,
+    MIN_PREVIEW_SEC,
     MODIFIER_FLAGS,
     MODIFIER_KEY_CODES,
     NS_FLAGS_CHANGED_MASK,
     NS_KEY_DOWN_MASK,
     PREVIEW_INTERVAL_SEC,
 )
-from .formatter import Formatter
+from .formatter import FormatStreamError, Formatter
 from .injector import Injector
 from .overlay import Overlay, StatusBarItem
 from . import preferences as prefs
 from .recorder import Recorder
-from .stt import STT
+from .stt import STT, is_model_cached
 
 
 class _AppDelegate(NSObject):
@@ -47,14 +67,22 @@ class _AppDelegate(NSObject):
 
     def applicationDidFinishLaunching_(self, notification):
         """Called by macOS after the app is fully launched."""
-        self.performSelector_withObject_afterDelay_("createUI:", None, 0.3)
+        # The run loop is already running here; queue createUI: for its
+        # next pass instead of waiting a fixed delay
+        self.performSelectorOnMainThread_withObject_waitUntilDone_(
+            "createUI:", None, False
+        )
+
+    def applicationWillTerminate_(self, notification):
+        """Called by macOS right before the app exits."""
+        self._voxbridge._shutdown()
 
     def createUI_(self, _):
         """Create UI components (called after event loop is fully running)."""
         app = self._voxbridge
-        app.overlay = Overlay.create(app.config["overlay"])
-        # Ensure user prompt file exists (copy bundled template on first launch)
-        app.formatter.ensure_user_prompt(prefs.USER_PROMPT_FILE)
+        # A disabled overlay is never created; _show_overlay then no-ops
+        if app._overlay_enabled:
+            app.overlay = Overlay.create(app.config["overlay"])
         hotkey = prefs.get_hotkey(app.config.get("hotkey", "alt_r"))
         model = prefs.get_model(app.config["stt"].get("model", "small"))
         format_level = prefs.get_format_level(
@@ -77,29 +105,22 @@ class _AppDelegate(NSObject):
         # Start hotkey listener now that event loop is running
         app._setup_hotkey()
 
-        # Reset stale accessibility permission if app binary changed (e.g. update)
-        app._reset_accessibility_if_needed()
-
-        # Check accessibility permission (required for text injection)
-        trusted = AXIsProcessTrustedWithOptions(
-            {"AXTrustedCheckOptionPrompt": True}
-        )
-        if trusted:
-            print("[VoxBridge] Accessibility: granted")
-        else:
-            print("[VoxBridge] Accessibility: NOT granted - text injection disabled")
-            print("[VoxBridge] Please grant Accessibility permission in System Settings")
+        # File I/O and tccutil run off the main thread; the accessibility
+        # prompt follows once they are done
+        app._background.submit(app._startup_io)
 
         # Background preload if requested
         if app._preload:
             app._start_preload()
         else:
-            app.overlay.show(
+            app._show_overlay(
                 f"VoxBridge Ready ({hotkey})", color="success", auto_hide=True,
             )
+            app._preload_done.set()
 
-        # Background Ollama check (always run to update menu items)
-        threading.Thread(target=app._check_ollama, daemon=True).start()
+        # Background Ollama check (always run to update menu items),
+        # concurrently with the STT preload
+        app._background.submit(app._check_ollama)
 
         print("[VoxBridge] UI initialized.")
 
@@ -122,43 +143,96 @@ class VoxBridgeApp:
 
         # Placeholders (created by delegate in applicationDidFinishLaunching_)
         self.overlay = None
+        self._overlay_enabled = self.config["overlay"].get("enabled", True)
         self.status_bar = None
 
         # Core components
+        sample_rate = self.config["recording"]["sample_rate"]
+        self._min_samples = int(sample_rate * MIN_AUDIO_SEC)
+        self._min_preview_samples = int(sample_rate * MIN_PREVIEW_SEC)
         self.recorder = Recorder(
-            sample_rate=self.config["recording"]["sample_rate"],
+            sample_rate=sample_rate,
             max_duration=self.config["recording"]["max_duration"],
             on_max_reached=self._on_max_duration_reached,
+            silence_dbfs=self.config["recording"]["silence_dbfs"],
+            min_rms=self.config["recording"]["min_rms"],
         )
         self.injector = Injector(self.config["injector"])
 
         # Lazy-loaded (heavy resources)
         self._stt: STT | None = None
         self._formatter: Formatter | None = None
+        # Guards lazy construction of _stt/_formatter from worker threads
+        self._lazy_lock = threading.Lock()
+        # Whether the selected STT model is on disk (refreshed on model change)
+        self._stt_cached = is_model_cached(
+            prefs.get_model(self.config["stt"].get("model", "small"))
+        )
 
-        # State
-        self._recording = False
-        self._processing = False
+        # State: "idle" -> "recording" -> "processing" -> "idle", changed
+        # only through _transition()/_set_state() from any thread
+        self._state = "idle"
+        self._state_lock = threading.Lock()
         self._live_preview_timer: threading.Timer | None = None
         self._countdown_timer: threading.Timer | None = None
         self._last_preview_text = ""
+        # (recording start, samples covered, text) of the latest preview;
+        # reused as the final transcript when no speech followed it
+        self._preview_result: tuple[float, int, str] | None = None
         self._recording_start_time: float = 0.0
+        # Esc key-down monitors, present only while recording
+        self._esc_monitors: list = []
+
+        # Coalesced overlay status posted from background threads
+        self._status_lock = threading.Lock()
+        self._pending_status: tuple[str, str, bool] | None = None
+        self._status_flush_scheduled = False
+
+        # Set once the STT preload has finished (successfully or not)
+        self._preload_done = threading.Event()
+
+        # Startup work (launch file I/O, STT preload, Ollama check) runs here
+        self._background = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="voxbridge-boot"
+        )
+
+        # Start loading the STT model now so it overlaps NSApplication
+        # startup; createUI_ attaches the status overlay via _start_preload
+        self._preload_future = (
+            self._background.submit(self._do_preload) if preload else None
+        )
+
+        # Recorder start/stop run on their own thread, in order
+        self._audio_cmds: queue.SimpleQueue = queue.SimpleQueue()
+        threading.Thread(target=self._audio_loop, daemon=True).start()
+
+        # Processing pipeline: one persistent worker fed by a queue
+        self._jobs: queue.Queue[tuple[np.ndarray, str | None]] = queue.Queue(maxsize=1)
+        threading.Thread(target=self._worker_loop, daemon=True).start()
 
     @property
     def stt(self) -> STT:
-        if self._stt is None:
-            stt_config = dict(self.config["stt"])
-            stt_config["model"] = prefs.get_model(
-                self.config["stt"].get("model", "small")
-            )
-            self._stt = STT(stt_config)
-        return self._stt
+        stt = self._stt
+        if stt is None:
+            with self._lazy_lock:
+                if self._stt is None:
+                    stt_config = dict(self.config["stt"])
+                    stt_config["model"] = prefs.get_model(
+                        self.config["stt"].get("model", "small")
+                    )
+                    self._stt = STT(stt_config)
+                stt = self._stt
+        return stt
 
     @property
     def formatter(self) -> Formatter:
-        if self._formatter is None:
-            self._formatter = Formatter(self.config["formatter"])
-        return self._formatter
+        formatter = self._formatter
+        if formatter is None:
+            with self._lazy_lock:
+                if self._formatter is None:
+                    self._formatter = Formatter(self.config["formatter"])
+                formatter = self._formatter
+        return formatter
 
     # --- Accessibility ---
 
@@ -176,7 +250,7 @@ class VoxBridgeApp:
         )
         sig_file = os.path.join(support_dir, "last_signature")
 
-        # Compute hash of the current executable
+        # Fingerprint the current executable
         # __file__ = .app/Contents/Resources/voxbridge/app.py
         # executable = .app/Contents/MacOS/VoxBridge
         contents_dir = os.path.dirname(
@@ -187,92 +261,143 @@ class VoxBridgeApp:
             # Running as CLI (python -m voxbridge), not .app — skip
             return
 
-        with open(exe_path, "rb") as f:
-            current_hash = hashlib.sha256(f.read()).hexdigest()
+        current_sig = self._binary_signature(exe_path)
 
-        # Compare with stored hash
-        previous_hash = None
+        # Compare with stored signature
+        previous_sig = None
         if os.path.isfile(sig_file):
             with open(sig_file, "r") as f:
-                previous_hash = f.read().strip()
+                previous_sig = f.read().strip()
 
-        if previous_hash != current_hash:
-            if previous_hash is not None:
+        if previous_sig != current_sig:
+            if previous_sig is not None:
                 print("[VoxBridge] Binary changed — resetting accessibility permission")
                 subprocess.run(
                     ["tccutil", "reset", "Accessibility", _BUNDLE_ID],
                     capture_output=True,
                 )
-            # Store current hash
+            # Store current signature
             os.makedirs(support_dir, exist_ok=True)
             with open(sig_file, "w") as f:
-                f.write(current_hash)
+                f.write(current_sig)
+
+    @staticmethod
+    def _binary_signature(exe_path: str) -> str:
+        """Return a fingerprint of the executable that changes on every rebuild.
+
+        Uses inode + mtime + size: a rebuild/re-sign always rewrites the
+        binary, so a single stat() is enough. Set VOXBRIDGE_HASH_BINARY=1
+        to use a full SHA-256 of the file contents instead.
+        """
+        if os.environ.get("VOXBRIDGE_HASH_BINARY") == "1":
+            # Stream the file through the hash instead of reading it into memory
+            with open(exe_path, "rb") as f:
+                if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                    return hashlib.file_digest(f, "sha256").hexdigest()
+                h = hashlib.sha256()
+                buf = bytearray(1 << 20)
+                view = memoryview(buf)
+                while n := f.readinto(buf):
+                    h.update(view[:n])
+                return h.hexdigest()
+
+        st = os.stat(exe_path)
+        return f"{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+
+    def _startup_io(self) -> None:
+        """Background: launch-time file work, then the accessibility check."""
+        try:
+            # Ensure user prompt file exists (copy bundled template on first launch)
+            self.formatter.ensure_user_prompt(prefs.USER_PROMPT_FILE)
+            # Reset stale accessibility permission if app binary changed (e.g. update)
+            self._reset_accessibility_if_needed()
+        except Exception as e:
+            print(f"[VoxBridge] Startup I/O error: {e}")
+        AppHelper.callAfter(self._check_accessibility)
+
+    def _check_accessibility(self) -> None:
+        """Check accessibility permission (required for text injection)."""
+        trusted = AXIsProcessTrustedWithOptions(
+            {"AXTrustedCheckOptionPrompt": True}
+        )
+        if trusted:
+            print("[VoxBridge] Accessibility: granted")
+        else:
+            print("[VoxBridge] Accessibility: NOT granted - text injection disabled")
+            print("[VoxBridge] Please grant Accessibility permission in System Settings")
 
     # --- Preload & Ollama ---
 
     def _start_preload(self) -> None:
-        """Start STT model preload in a background thread with status overlay."""
-        cached = self.stt.is_model_cached()
-        msg = "Loading STT model..." if cached else "Downloading STT model..."
-        self._show_overlay(msg, color="default")
-        print(f"[VoxBridge] {msg}")
+        """Show preload status; report the result when the load finishes.
 
-        def _do_preload():
-            try:
-                self.stt.preload()
+        The load itself was started from __init__ so it overlaps UI setup.
+        """
+        if not self._preload_future.done():
+            cached = self._stt_cached
+            msg = "Loading STT model..." if cached else "Downloading STT model..."
+            self._show_overlay(msg, color="default")
+            print(f"[VoxBridge] {msg}")
+        self._preload_future.add_done_callback(self._on_preload_done)
+
+    def _do_preload(self) -> None:
+        """Background: load and warm up the STT model."""
+        self.stt.preload()
+        # Warm up CTranslate2 kernels/thread pools so the first real
+        # transcription doesn't pay the cold-start cost
+        try:
+            self.stt.warmup()
+        except Exception as e:
+            print(f"[VoxBridge] STT warm-up skipped: {e}")
+        print("[VoxBridge] STT model preloaded.")
+
+    def _on_preload_done(self, future) -> None:
+        """Post the preload result overlay (runs on whichever thread finished)."""
+        try:
+            e = future.exception()
+            if e is None:
                 hotkey = prefs.get_hotkey(self.config.get("hotkey", "alt_r"))
-                AppHelper.callAfter(
-                    lambda: self._show_overlay(
-                        f"VoxBridge Ready ({hotkey})",
-                        color="success",
-                        auto_hide=True,
-                    )
-                )
-                print("[VoxBridge] STT model preloaded.")
-            except Exception as e:
+                AppHelper.callAfter(functools.partial(
+                    self._show_overlay,
+                    f"VoxBridge Ready ({hotkey})",
+                    color="success",
+                    auto_hide=True,
+                ))
+            else:
                 print(f"[VoxBridge] Preload error: {e}")
-                AppHelper.callAfter(
-                    lambda: self._show_overlay(
-                        f"Preload error: {str(e)[:40]}",
-                        color="error",
-                        auto_hide=True,
-                    )
-                )
-
-        threading.Thread(target=_do_preload, daemon=True).start()
+                AppHelper.callAfter(functools.partial(
+                    self._show_overlay,
+                    f"Preload error: {str(e)[:40]}",
+                    color="error",
+                    auto_hide=True,
+                ))
+        finally:
+            # Set after the overlay is queued so Ollama warnings follow it
+            self._preload_done.set()
 
     def _check_ollama(self) -> None:
         """Check Ollama and model availability; update menu items."""
-        # Delay to avoid conflicting with preload overlay messages
-        time.sleep(3)
         ollama_ok, model_ok = self.formatter.check_status()
 
         if self.status_bar:
-            AppHelper.callAfter(
-                lambda: self.status_bar.set_ollama_available(ollama_ok)
-            )
-            AppHelper.callAfter(
-                lambda: self.status_bar.set_model_available(model_ok)
+            self._main_thread_batch(
+                lambda: self.status_bar.set_ollama_available(ollama_ok),
+                lambda: self.status_bar.set_model_available(model_ok),
             )
 
+        # Menu items are updated right away; warnings wait for the preload
+        # status so they aren't overwritten by "Ready"
+        if not (ollama_ok and model_ok):
+            self._preload_done.wait(timeout=10)
+
         if not ollama_ok:
             print("[VoxBridge] Ollama is not running")
-            AppHelper.callAfter(
-                lambda: self._show_overlay(
-                    "Ollama not found",
-                    color="warning",
-                    auto_hide=True,
-                )
-            )
+            self._post_status("Ollama not found", color="warning", auto_hide=True)
         elif not model_ok:
             model = self.formatter.model
             print(f"[VoxBridge] Ollama running but model '{model}' not found")
-            AppHelper.callAfter(
-                lambda: self._show_overlay(
-                    f"Model not found: {model}",
-                    color="warning",
-                    auto_hide=True,
-                )
+            self._post_status(
+                f"Model not found: {model}", color="warning", auto_hide=True,
             )
         else:
             print("[VoxBridge] Ollama and model ready")
@@ -283,6 +408,7 @@ class VoxBridgeApp:
         """Called when user selects a new STT model from the menu."""
         prefs.set_model(model_name)
         self._stt = None  # Reset so next transcription uses the new model
+        self._stt_cached = is_model_cached(model_name)
         self._show_overlay(f"STT Model: {model_name}", color="success", auto_hide=True)
         print(f"[VoxBridge] STT model changed to: {model_name}")
 
@@ -303,30 +429,39 @@ class VoxBridgeApp:
         """Download the configured Ollama model in the background."""
         if self.status_bar:
             AppHelper.callAfter(
-                lambda: self.status_bar.set_download_in_progress(True)
+                functools.partial(self.status_bar.set_download_in_progress, True)
             )
         self._show_overlay("Downloading model...", color="default")
 
         def on_progress(line):
-            AppHelper.callAfter(
-                lambda l=line: self._show_overlay(l[:40], color="default")
-            )
+            # ollama pull emits many lines per second; draw only the latest
+            self._post_status(line[:40])
 
         def on_complete():
-            AppHelper.callAfter(lambda: self._show_overlay(
-                "Model downloaded", color="success", auto_hide=True
-            ))
+            updates = [functools.partial(
+                self._show_overlay,
+                "Model downloaded", color="success", auto_hide=True,
+            )]
             if self.status_bar:
-                AppHelper.callAfter(lambda: self.status_bar.set_download_in_progress(False))
-                AppHelper.callAfter(lambda: self.status_bar.set_model_available(True))
+                updates.append(
+                    functools.partial(self.status_bar.set_download_in_progress, False)
+                )
+                updates.append(
+                    functools.partial(self.status_bar.set_model_available, True)
+                )
+            self._main_thread_batch(*updates)
             print("[VoxBridge] Model download complete.")
 
         def on_error(err):
-            AppHelper.callAfter(lambda: self._show_overlay(
-                f"Download error: {err[:40]}", color="error", auto_hide=True
-            ))
+            updates = [functools.partial(
+                self._show_overlay,
+                f"Download error: {err[:40]}", color="error", auto_hide=True,
+            )]
             if self.status_bar:
-                AppHelper.callAfter(lambda: self.status_bar.set_download_in_progress(False))
+                updates.append(
+                    functools.partial(self.status_bar.set_download_in_progress, False)
+                )
+            self._main_thread_batch(*updates)
             print(f"[VoxBridge] Model download error: {err}")
 
         self.formatter.pull_model(
@@ -350,28 +485,51 @@ class VoxBridgeApp:
             return
 
         if enabled:
-            subprocess.run([
-                "osascript", "-e",
-                f'tell application "System Events" to make login item at end '
-                f'with properties {{path:"{bundle_path}", hidden:false}}'
-            ], capture_output=True)
+            if not self._set_login_item_native(True):
+                subprocess.run([
+                    "osascript", "-e",
+                    f'tell application "System Events" to make login item at end '
+                    f'with properties {{path:"{bundle_path}", hidden:false}}'
+                ], capture_output=True)
             prefs.set_launch_at_login_flag(True)
             self._show_overlay("Launch at login: ON", color="success", auto_hide=True)
             print(f"[VoxBridge] Launch at login enabled: {bundle_path}")
         else:
-            app_name = os.path.basename(bundle_path).replace(".app", "")
-            subprocess.run([
-                "osascript", "-e",
-                f'tell application "System Events" to delete login item "{app_name}"'
-            ], capture_output=True)
+            # Items added by older versions via System Events aren't known
+            # to SMAppService; unregistering fails and osascript removes them
+            if not self._set_login_item_native(False):
+                app_name = os.path.basename(bundle_path).replace(".app", "")
+                subprocess.run([
+                    "osascript", "-e",
+                    f'tell application "System Events" to delete login item "{app_name}"'
+                ], capture_output=True)
             prefs.set_launch_at_login_flag(False)
             self._show_overlay("Launch at login: OFF", color="success", auto_hide=True)
             print("[VoxBridge] Launch at login disabled")
 
+    @staticmethod
+    def _set_login_item_native(enabled: bool) -> bool:
+        """Register/unregister the app via SMAppService (macOS 13+).
+
+        Returns False if the API is unavailable or the call failed, so the
+        caller can fall back to System Events.
+        """
+        try:
+            from ServiceManagement import SMAppService
+        except ImportError:
+            return False
+        service = SMAppService.mainAppService()
+        if enabled:
+            ok, err = service.registerAndReturnError_(None)
+        else:
+            ok, err = service.unregisterAndReturnError_(None)
+        if not ok:
+            print(f"[VoxBridge] SMAppService failed, using osascript: {err}")
+        return bool(ok)
+
     def _on_hotkey_change(self, key: str) -> None:
         """Called when user selects a new hotkey from the menu."""
-        self._hotkey_code = MODIFIER_KEY_CODES.get(key)
-        self._hotkey_flag = MODIFIER_FLAGS.get(key, 0)
+        self._hotkey_match = (MODIFIER_KEY_CODES.get(key), MODIFIER_FLAGS.get(key, 0))
         prefs.set_hotkey(key)
         label = HOTKEY_LABELS.get(key, key)
         self._show_overlay(f"Hotkey: {label}", color="success", auto_hide=True)
@@ -382,42 +540,114 @@ class VoxBridgeApp:
     def _setup_hotkey(self) -> None:
         """Configure the global push-to-talk hotkey using NSEvent monitors."""
         hotkey_name = prefs.get_hotkey(self.config.get("hotkey", "alt_r"))
-        self._hotkey_code = MODIFIER_KEY_CODES.get(hotkey_name)
-        self._hotkey_flag = MODIFIER_FLAGS.get(hotkey_name, 0)
+        # (keycode, modifier flag) read as one attribute by the callbacks;
+        # swapped as a whole when the hotkey changes
+        self._hotkey_match = (
+            MODIFIER_KEY_CODES.get(hotkey_name), MODIFIER_FLAGS.get(hotkey_name, 0)
+        )
 
-        if self._hotkey_code is not None:
-            NSEvent.addGlobalMonitorForEventsMatchingMask_handler_(
-                NS_FLAGS_CHANGED_MASK, self._on_flags_changed,
-            )
-            NSEvent.addLocalMonitorForEventsMatchingMask_handler_(
-                NS_FLAGS_CHANGED_MASK, self._on_flags_changed_local,
-            )
-            NSEvent.addGlobalMonitorForEventsMatchingMask_handler_(
-                NS_KEY_DOWN_MASK, self._on_key_down,
-            )
-            NSEvent.addLocalMonitorForEventsMatchingMask_handler_(
-                NS_KEY_DOWN_MASK, self._on_key_down_local,
-            )
-            print(f"[VoxBridge] Hotkey: {hotkey_name} (push-to-talk, NSEvent monitor)")
+        if self._hotkey_match[0] is not None:
+            if self._install_flags_tap():
+                mechanism = "CGEventTap"
+            else:
+                # Tap creation refused (e.g. permission not yet granted)
+                NSEvent.addGlobalMonitorForEventsMatchingMask_handler_(
+                    NS_FLAGS_CHANGED_MASK, self._on_flags_changed,
+                )
+                NSEvent.addLocalMonitorForEventsMatchingMask_handler_(
+                    NS_FLAGS_CHANGED_MASK, self._on_flags_changed_local,
+                )
+                mechanism = "NSEvent monitor"
+            print(f"[VoxBridge] Hotkey: {hotkey_name} (push-to-talk, {mechanism})")
         else:
             print(f"[VoxBridge] WARNING: Unsupported hotkey '{hotkey_name}'")
 
+    def _install_flags_tap(self) -> bool:
+        """Listen for modifier changes with one session-wide CGEventTap.
+
+        Replaces the global + local NSEvent monitor pair: the tap also sees
+        events aimed at VoxBridge itself, and the callback reads the keycode
+        straight from the CGEvent without building an NSEvent. Returns False
+        if the tap could not be created.
+        """
+        tap = CGEventTapCreate(
+            kCGSessionEventTap,
+            kCGHeadInsertEventTap,
+            kCGEventTapOptionListenOnly,
+            CGEventMaskBit(kCGEventFlagsChanged),
+            self._on_flags_tap,
+            None,
+        )
+        if tap is None:
+            return False
+        source = CFMachPortCreateRunLoopSource(None, tap, 0)
+        CFRunLoopAddSource(CFRunLoopGetMain(), source, kCFRunLoopCommonModes)
+        CGEventTapEnable(tap, True)
+        # Keep both alive for the lifetime of the app
+        self._flags_tap = tap
+        self._flags_tap_source = source
+        return True
+
+    def _on_flags_tap(self, proxy, event_type, event, refcon):
+        """CGEventTap callback for modifier key changes (main run loop)."""
+        if event_type != kCGEventFlagsChanged:
+            # Only the tap-disabled notifications arrive with another type
+            if event_type in (kCGEventTapDisabledByTimeout, kCGEventTapDisabledByUserInput):
+                CGEventTapEnable(self._flags_tap, True)
+            return event
+        code, flag = self._hotkey_match
+        if CGEventGetIntegerValueField(event, kCGKeyboardEventKeycode) != code:
+            return event
+        # CGEventFlags share bit positions with the NSEvent modifier masks
+        if CGEventGetFlags(event) & flag:
+            self._on_press()
+        else:
+            self._on_release()
+        return event
+
     def _on_flags_changed(self, event) -> None:
         """Global monitor callback for modifier key changes."""
-        if event.keyCode() == self._hotkey_code:
-            if event.modifierFlags() & self._hotkey_flag:
-                self._on_press()
-            else:
-                self._on_release()
+        # Every modifier change system-wide lands here: bail out after a
+        # single bridge call unless it's our key
+        code, flag = self._hotkey_match
+        if event.keyCode() != code:
+            return
+        if event.modifierFlags() & flag:
+            self._on_press()
+        else:
+            self._on_release()
 
     def _on_flags_changed_local(self, event):
         """Local monitor callback (when VoxBridge window is focused)."""
         self._on_flags_changed(event)
         return event
 
+    def _install_esc_monitors(self) -> None:
+        """Main thread: watch key-downs for Esc while a recording is active.
+
+        Installed per recording so ordinary typing doesn't reach Python.
+        """
+        if self._esc_monitors:
+            return
+        self._esc_monitors = [
+            NSEvent.addGlobalMonitorForEventsMatchingMask_handler_(
+                NS_KEY_DOWN_MASK, self._on_key_down,
+            ),
+            NSEvent.addLocalMonitorForEventsMatchingMask_handler_(
+                NS_KEY_DOWN_MASK, self._on_key_down_local,
+            ),
+        ]
+
+    def _remove_esc_monitors(self) -> None:
+        """Main thread: remove the Esc monitors installed for a recording."""
+        for monitor in self._esc_monitors:
+            if monitor is not None:
+                NSEvent.removeMonitor_(monitor)
+        self._esc_monitors = []
+
     def _on_key_down(self, event) -> None:
         """Global monitor for key-down events (Esc to cancel)."""
-        if event.keyCode() == KEY_ESCAPE and self._recording:
+        if self._recording and event.keyCode() == KEY_ESCAPE:
             self._cancel_recording()
 
     def _on_key_down_local(self, event):
@@ -427,11 +657,29 @@ class VoxBridgeApp:
 
     # --- Recording ---
 
+    @property
+    def _recording(self) -> bool:
+        return self._state == "recording"
+
+    def _transition(self, expected: str, new: str) -> bool:
+        """Atomically move from expected to new state; False if not in expected."""
+        with self._state_lock:
+            if self._state != expected:
+                return False
+            self._state = new
+            return True
+
+    def _set_state(self, new: str) -> None:
+        with self._state_lock:
+            self._state = new
+
     def _cancel_recording(self) -> None:
         """Cancel the current recording and discard audio."""
-        self._recording = False
+        if not self._transition("recording", "idle"):
+            return
+        self._remove_esc_monitors()
         self._stop_live_preview()
-        self.recorder.stop()
+        self._audio_cmds.put(("stop", None))  # discard the audio
         self._show_overlay("Cancelled", color="default", auto_hide=True)
         print("[VoxBridge] Recording cancelled.")
 
@@ -440,47 +688,124 @@ class VoxBridgeApp:
         if self.overlay:
             self.overlay.show(text, color=color, auto_hide=auto_hide)
 
+    @staticmethod
+    def _main_thread_batch(*callables) -> None:
+        """Run several UI updates on the main thread in a single hop."""
+        def run():
+            for fn in callables:
+                fn()
+        AppHelper.callAfter(run)
+
+    def _post_status(self, text, color="default", auto_hide=False):
+        """Show overlay from any thread, coalescing bursts of updates.
+
+        Only the latest status is kept; at most one main-thread flush is
+        pending at a time, so stale intermediate states are never drawn.
+        """
+        if not self._overlay_enabled:
+            return
+        with self._status_lock:
+            self._pending_status = (text, color, auto_hide)
+            if self._status_flush_scheduled:
+                return
+            self._status_flush_scheduled = True
+        AppHelper.callAfter(self._flush_status)
+
+    def _flush_status(self) -> None:
+        """Main thread: draw the latest status posted by _post_status."""
+        with self._status_lock:
+            status = self._pending_status
+            self._pending_status = None
+            self._status_flush_scheduled = False
+        if status is not None:
+            text, color, auto_hide = status
+            self._show_overlay(text, color=color, auto_hide=auto_hide)
+
     def _on_max_duration_reached(self, audio) -> None:
         """Called when recording reaches max duration (audio already stopped)."""
-        self._recording = False
+        if not self._transition("recording", "processing"):
+            return
+        AppHelper.callAfter(self._remove_esc_monitors)
         self._stop_live_preview()
         max_sec = self.config["recording"]["max_duration"]
         print(f"[VoxBridge] Max recording duration reached ({max_sec}s)")
 
-        if audio is not None and len(audio) > MIN_AUDIO_SAMPLES:
-            self._processing = True
-            AppHelper.callAfter(
-                lambda: self._show_overlay(
-                    f"⏱ Max {max_sec}s reached — processing...", color="warning"
-                )
+        if audio.size > self._min_samples:
+            self._post_status(
+                f"⏱ Max {max_sec}s reached — processing...", color="warning"
             )
-            threading.Thread(
-                target=self._process, args=(audio,), daemon=True
-            ).start()
+            self._enqueue(audio, self._reusable_preview())
+        else:
+            self._set_state("idle")
 
     def _on_press(self) -> None:
         """Hotkey press handler - start recording."""
-        if not self._recording and not self._processing:
-            self._recording = True
+        if self._transition("idle", "recording"):
+            # Per-recording: a preview from an earlier take never matches
+            self._preview_result = None
+            self._recording_start_time = time.time()
+            self._install_esc_monitors()
             self._show_overlay("Recording...", color="recording")
-            self.recorder.start()
+            self._audio_cmds.put(("start", None))
             if self._stt is not None:
                 self._start_live_preview()
 
     def _on_release(self) -> None:
         """Hotkey release handler - stop recording and process."""
-        if self._recording:
-            self._recording = False
+        # "processing" blocks new presses until the audio thread has handed
+        # this recording off (or rejected it as too short)
+        if self._transition("recording", "processing"):
+            self._remove_esc_monitors()
             self._stop_live_preview()
-            audio = self.recorder.stop()
+            self._audio_cmds.put(("stop", self._handle_audio))
 
-            if audio is not None and len(audio) > MIN_AUDIO_SAMPLES:
-                self._processing = True
-                threading.Thread(
-                    target=self._process, args=(audio,), daemon=True
-                ).start()
+    def _handle_audio(self, audio: np.ndarray) -> None:
+        """Audio thread: queue a finished recording for processing."""
+        if audio.size > self._min_samples:
+            self._enqueue(audio, self._reusable_preview())
+        else:
+            self._set_state("idle")
+            if self.recorder.no_speech:
+                self._post_status("No speech detected", auto_hide=True)
             else:
-                self._show_overlay("Too short", color="default", auto_hide=True)
+                self._post_status("Too short", auto_hide=True)
+
+    def _reusable_preview(self) -> str | None:
+        """Return the live-preview transcript if it already covers all speech.
+
+        The preview transcribes the growing buffer while the key is held;
+        when the speaker stopped before its last snapshot, the final pass
+        would decode the same speech again, so its text is used as is.
+        """
+        result = self._preview_result
+        if result is None:
+            return None
+        started, covered, text = result
+        if started != self._recording_start_time:
+            return None
+        if self.recorder.speech_end > covered:
+            return None
+        return text
+
+    def _audio_loop(self) -> None:
+        """Audio thread: run recorder start/stop off the event callbacks.
+
+        Opening and closing the CoreAudio stream can take a while; doing it
+        here keeps the hotkey handlers (main thread) from stalling.
+        """
+        while True:
+            cmd, on_audio = self._audio_cmds.get()
+            try:
+                if cmd == "start":
+                    self.recorder.start()
+                else:
+                    audio = self.recorder.stop()
+                    if on_audio is not None:
+                        on_audio(audio)
+            except Exception as e:
+                print(f"[VoxBridge] Audio {cmd} error: {e}")
+                if on_audio is not None:
+                    self._set_state("idle")
 
     # --- Live preview ---
 
@@ -492,8 +817,6 @@ class VoxBridgeApp:
     def _start_live_preview(self) -> None:
         """Start periodic live transcription preview during recording."""
         self._last_preview_text = ""
-        self._recording_start_time = time.time()
-
         self._schedule_preview_tick()
         self._schedule_countdown()
 
@@ -509,12 +832,15 @@ class VoxBridgeApp:
         """Run one live preview STT cycle."""
         if not self._recording:
             return
+        started = self._recording_start_time
         snapshot = self.recorder.get_audio_snapshot()
-        if snapshot is not None and len(snapshot) > MIN_PREVIEW_SAMPLES:
+        if snapshot.size > self._min_preview_samples:
             try:
                 text = self.stt.transcribe(
                     snapshot, language=self.config.get("language")
                 )
+                if text:
+                    self._preview_result = (started, snapshot.size, text)
                 if text and text.strip() and text != self._last_preview_text:
                     self._last_preview_text = text
                     remaining = self._get_remaining_time()
@@ -524,11 +850,7 @@ class VoxBridgeApp:
                     else:
                         suffix = ""
                         color = "recording"
-                    AppHelper.callAfter(
-                        lambda d=text, s=suffix, c=color: self._show_overlay(
-                            f"🎤 {d}{s}", color=c
-                        )
-                    )
+                    self._post_status(f"🎤 {text}{suffix}", color=color)
             except Exception:
                 pass
         if self._recording:
@@ -549,10 +871,8 @@ class VoxBridgeApp:
         remaining = self._get_remaining_time()
         if remaining <= COUNTDOWN_START_SEC:
             display_text = self._last_preview_text or "Recording..."
-            AppHelper.callAfter(
-                lambda r=int(remaining), d=display_text: self._show_overlay(
-                    f"🎤 {d}\n⏱ {r}s remaining", color="warning"
-                )
+            self._post_status(
+                f"🎤 {display_text}\n⏱ {int(remaining)}s remaining", color="warning"
             )
         if remaining > 0 and self._recording:
             self._countdown_timer = threading.Timer(
@@ -573,28 +893,38 @@ class VoxBridgeApp:
 
     # --- Processing pipeline ---
 
-    def _process(self, audio: np.ndarray) -> None:
-        """Background: transcribe, format, inject."""
+    def _enqueue(self, audio: np.ndarray, text: str | None = None) -> None:
+        """Hand recorded audio (and its transcript, if known) to the worker."""
+        try:
+            self._jobs.put_nowait((audio, text))
+        except queue.Full:
+            self._post_status("Busy", color="warning", auto_hide=True)
+
+    def _worker_loop(self) -> None:
+        """Persistent worker thread: process queued utterances one at a time."""
+        while True:
+            audio, text = self._jobs.get()
+            self._process(audio, text)
+
+    def _process(self, audio: np.ndarray, text: str | None = None) -> None:
+        """Background: transcribe (unless already done), format, inject."""
         try:
-            # Step 1: STT
-            if self._stt is None:
-                cached = STT(self.config["stt"]).is_model_cached()
-                stt_msg = "Loading STT model..." if cached else "Downloading STT model..."
+            # Step 1: STT (skipped when the live preview already covered it)
+            if text is None:
+                if self._stt is None:
+                    cached = self._stt_cached
+                    stt_msg = "Loading STT model..." if cached else "Downloading STT model..."
+                else:
+                    stt_msg = "Transcribing..."
+                self._post_status(stt_msg)
+                language = self.config.get("language")
+                text = self.stt.transcribe(audio, language=language)
+                print(f"[STT] Raw: {text}")
             else:
-                stt_msg = "Transcribing..."
-            AppHelper.callAfter(
-                lambda: self._show_overlay(stt_msg, color="default")
-            )
-            language = self.config.get("language")
-            text = self.stt.transcribe(audio, language=language)
-            print(f"[STT] Raw: {text}")
+                print(f"[STT] Raw (from live preview): {text}")
 
             if not text or not text.strip():
-                AppHelper.callAfter(
-                    lambda: self._show_overlay(
-                        "No speech detected", color="default", auto_hide=True
-                    )
-                )
+                self._post_status("No speech detected", auto_hide=True)
                 return
 
             # Step 2: Format / Translate (optional)
@@ -602,53 +932,96 @@ class VoxBridgeApp:
                 self.config["formatter"].get("enabled", True)
             )
             if format_level == "on":
-                AppHelper.callAfter(
-                    lambda: self._show_overlay("Formatting...", color="default")
-                )
-                formatted = self.formatter.format(text)
-                print(f"[Formatter] Result: {formatted}")
+                self._post_status("Formatting...")
+                pieces = self.formatter.format_stream(text)
+                log_label = "[Formatter] Result"
             elif format_level.startswith("translate_"):
                 direction = "JA→EN" if format_level == "translate_ja_en" else "EN→JA"
-                AppHelper.callAfter(
-                    lambda d=direction: self._show_overlay(f"Translating ({d})...", color="default")
-                )
-                formatted = self.formatter.format(text, mode=format_level)
-                print(f"[Translator] {direction}: {formatted}")
+                self._post_status(f"Translating ({direction})...")
+                pieces = self.formatter.format_stream(text, mode=format_level)
+                log_label = f"[Translator] {direction}"
             else:
-                formatted = text
-
-            # Step 3: Inject into active app
-            AppHelper.callAfter(
-                lambda: self._show_overlay("Typing...", color="default")
-            )
-            injected = self.injector.inject(formatted)
+                pieces = None
+
+            # Step 3: Inject into active app. LLM output is typed sentence
+            # by sentence while the rest is still being generated.
+            active = self.injector.get_active_app_name()
+            if pieces is not None and self.injector.can_stream(active):
+                parts = []
+                injected = True
+                pasted_rest = False
+                pieces = iter(pieces)
+                try:
+                    for piece in pieces:
+                        if not parts:
+                            self._post_status("Typing...")
+                        if not self.injector.can_type(piece, active):
+                            # A newline can't be typed safely: paste this
+                            # piece and the rest in one go, not piece by piece
+                            rest = piece + "".join(pieces)
+                            injected = self.injector.inject(rest) and injected
+                            parts.append(rest)
+                            pasted_rest = True
+                            break
+                        ok = self.injector.inject(piece, press_enter=False)
+                        injected = injected and ok
+                        parts.append(piece)
+                except FormatStreamError as e:
+                    if not parts:
+                        # Nothing typed yet: fall back to the raw transcript
+                        parts.append(text)
+                        injected = self.injector.inject(text)
+                        pasted_rest = True
+                    else:
+                        # Part of the result is already typed; don't report
+                        # success or press Enter on a truncated line
+                        print(f"{log_label} (interrupted): {''.join(parts)}")
+                        self._post_status(
+                            f"Formatting failed midway: {str(e)[:40]}",
+                            color="error", auto_hide=True,
+                        )
+                        return
+                if injected and not pasted_rest:
+                    self.injector.press_enter_if_needed(active)
+                formatted = "".join(parts)
+            else:
+                if pieces is None:
+                    formatted = text
+                else:
+                    # Nothing typed yet, so a mid-stream failure can
+                    # still fall back to the raw transcript
+                    try:
+                        formatted = "".join(pieces)
+                    except FormatStreamError:
+                        formatted = text
+                self._post_status("Typing...")
+                injected = self.injector.inject(formatted)
+            if pieces is not None:
+                print(f"{log_label}: {formatted}")
 
             if injected:
-                AppHelper.callAfter(
-                    lambda: self._show_overlay("Done", color="success", auto_hide=True)
-                )
+                self._post_status("Done", color="success", auto_hide=True)
             else:
-                AppHelper.callAfter(
-                    lambda: self._show_overlay(
-                        "Copied (要 Accessibility 許可)",
-                        color="warning", auto_hide=True,
-                    )
+                self._post_status(
+                    "Copied (要 Accessibility 許可)",
+                    color="warning", auto_hide=True,
                 )
 
         except Exception as e:
             msg = str(e)[:60]
             print(f"[VoxBridge] Error: {e}")
-            AppHelper.callAfter(
-                lambda: self._show_overlay(
-                    f"Error: {msg}", color="error", auto_hide=True
-                )
-            )
+            self._post_status(f"Error: {msg}", color="error", auto_hide=True)
         finally:
-            self._processing = False
+            self._set_state("idle")
             print("[VoxBridge] Ready for next input.")
 
     # --- Entry point ---
 
+    def _shutdown(self) -> None:
+        """Release network resources on exit."""
+        if self._formatter is not None:
+            self._formatter.close()
+
     def run(self) -> None:
         """Start the application (blocks on main thread)."""
         print("[VoxBridge] Starting...")
@@ -658,8 +1031,7 @@ class VoxBridgeApp:
         print(f"[VoxBridge] Language: {lang}")
         print("[VoxBridge] Ready. Hold the hotkey to record, release to process.")
 
-        # Handle Ctrl+C gracefully
-        signal.signal(signal.SIGINT, lambda *_: AppHelper.stopEventLoop())
-
-        # runEventLoop calls finishLaunching → delegate creates UI
-        AppHelper.runEventLoop()
+        # runEventLoop calls finishLaunching → delegate creates UI.
+        # installInterrupt routes SIGINT through a Mach port run-loop source,
+        # so Ctrl+C is handled even while the loop is blocked waiting
+        AppHelper.runEventLoop(installInterrupt=True)
@@ -1,6 +1,8 @@
 """Configuration loading and defaults."""
 
+import copy
 import os
+
 import yaml
 
 _DEFAULT_CONFIG = {
@@ -9,22 +11,26 @@ _DEFAULT_CONFIG = {
     "recording": {
         "sample_rate": 16000,
         "max_duration": 60,
+        "silence_dbfs": -40.0,
+        "min_rms": 0.005,
     },
     "stt": {
         "model": "small",
         "device": "cpu",
-        "compute_type": "int8",
+        "compute_type": "auto",
     },
     "formatter": {
         "enabled": True,
         "model": "qwen3:8b",
         "prompt_file": "prompts/format.txt",
         "timeout": 30,
+        "skip_clean_short_text": True,
     },
     "injector": {
         "send_enter_for": ["Terminal", "iTerm2", "Alacritty", "kitty", "Warp"],
         "enter_delay": 0.15,
         "clipboard_restore_delay": 0.3,
+        "method": "paste",
     },
     "overlay": {
         "enabled": True,
@@ -37,15 +43,14 @@ _DEFAULT_CONFIG = {
 }
 
 
-def _deep_merge(base: dict, override: dict) -> dict:
-    """Recursively merge override into base."""
-    result = base.copy()
+def _deep_merge(base: dict, override: dict) -> None:
+    """Recursively merge override into base, in place."""
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _deep_merge(current, value)
         else:
-            result[key] = value
-    return result
+            base[key] = value
 
 
 def load_config(path: str | None = None) -> dict:
@@ -55,12 +60,14 @@ def load_config(path: str | None = None) -> dict:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         path = os.path.join(project_root, "config.yaml")
 
-    config = _DEFAULT_CONFIG.copy()
+    # One deep copy up front; the merge and the fix-ups below then mutate
+    # it in place without touching the module-level defaults
+    config = copy.deepcopy(_DEFAULT_CONFIG)
 
     if os.path.exists(path):
         with open(path, "r", encoding="utf-8") as f:
             user_config = yaml.safe_load(f) or {}
-        config = _deep_merge(config, user_config)
+        _deep_merge(config, user_config)
 
     # Resolve prompt_file path relative to project root
     prompt_file = config["formatter"]["prompt_file"]
@@ -68,4 +75,23 @@ def load_config(path: str | None = None) -> dict:
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         config["formatter"]["prompt_file"] = os.path.join(project_root, prompt_file)
 
+    _check_stt_compute_type(config["stt"])
+
     return config
+
+
+def _check_stt_compute_type(stt: dict) -> None:
+    """Validate stt.compute_type and warn about float types on CPU.
+
+    INT8 transcription is ~2x faster than float32 on CPU with a negligible
+    accuracy difference; "auto" picks a quantized type per machine.
+    """
+    compute_type = stt.get("compute_type", "auto")
+    if not isinstance(compute_type, str):
+        raise ValueError(
+            f"stt.compute_type must be a string such as \"auto\" or \"int8\", "
+            f"got {compute_type!r}"
+        )
+    if stt.get("device", "cpu") == "cpu" and compute_type.startswith("float"):
+        print(f"[Config] stt.compute_type={compute_type} on CPU is slower than "
+              "int8; use \"auto\" for a quantized type")
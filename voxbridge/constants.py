@@ -1,8 +1,8 @@
 """Shared constants for VoxBridge."""
 
-# --- Audio thresholds (sample count at 16kHz) ---
-MIN_AUDIO_SAMPLES = 1600      # ~0.1s — minimum to process after recording
-MIN_PREVIEW_SAMPLES = 8000    # ~0.5s — minimum for live preview STT
+# --- Audio thresholds (seconds; scaled by the configured sample rate) ---
+MIN_AUDIO_SEC = 0.1           # minimum to process after recording
+MIN_PREVIEW_SEC = 0.5         # minimum for live preview STT
 
 # --- Recording timers ---
 PREVIEW_INTERVAL_SEC = 1.5    # Live preview STT interval
@@ -1,10 +1,78 @@
 """Text formatting using local LLM via Ollama."""
 
+import codecs
 import os
+import re
 import shutil
 import subprocess
 import threading
 
+# Formatting is optional; fall back to raw text. Imported separately so the
+# status probe (httpx) still works when only the ollama package is missing.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+try:
+    import ollama
+except ImportError:
+    ollama = None
+
+# Fallback inline prompt (used when no prompt file is available)
+_FALLBACK_PROMPT = (
+    "音声認識テキストを自然な書き言葉に整形してください。"
+    "フィラーを除去し、句読点を追加してください。"
+    "整形結果のみを出力してください。\n\n"
+    "入力テキスト:\n{text}"
+)
+
+
+def _split_template(template: str) -> tuple[str, str]:
+    """Split a prompt template around its {text} placeholder.
+
+    The prompt is then built as prefix + text + suffix, without rescanning
+    the template on every call.
+    """
+    prefix, sep, suffix = template.partition("{text}")
+    if not sep:
+        return template, ""
+    return prefix, suffix
+
+
+# Terminal control sequences (cursor hide/show, line erase) in `ollama pull` output
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+# Short, already punctuated utterances without fillers skip the LLM. Matching
+# errs on the side of "has a filler": a false hit only costs the LLM call.
+_SHORTCUT_MAX_CHARS = 40
+_FILLER_RE = re.compile(
+    r"えー|ええと|えっと|あの|その[ー、]|うーん|まあ|"
+    r"(?i:\b(?:u+m+|u+h+|e+r+|a+h+|hmm+)\b)"
+)
+_TERMINAL_PUNCT = "。．！？.!?"
+
+# Characters after which a streamed piece can be handed out
+_SENTENCE_ENDS = ("。", "．", "！", "？", ".", "!", "?")
+
+
+def _sentence_cut(buf: str) -> int:
+    """Return the index just past the last sentence terminator in buf (0 if none)."""
+    return max(buf.rfind(c) for c in _SENTENCE_ENDS) + 1
+
+
+def _needs_no_formatting(text: str) -> bool:
+    """Return True if text is short, punctuated and free of fillers."""
+    text = text.strip()
+    return (
+        len(text) < _SHORTCUT_MAX_CHARS
+        and text[-1] in _TERMINAL_PUNCT
+        and not _FILLER_RE.search(text)
+    )
+
+
+class FormatStreamError(RuntimeError):
+    """Ollama failed after format_stream() had already yielded output."""
+
 
 class Formatter:
     """Formats transcribed text using a local LLM (Ollama)."""
@@ -12,10 +80,16 @@ class Formatter:
     def __init__(self, config: dict):
         self.model = config.get("model", "qwen3:8b")
         self.timeout = config.get("timeout", 30)
+        # Skip the LLM for short, clean utterances (see _needs_no_formatting)
+        self.skip_clean = config.get("skip_clean_short_text", True)
         self._bundled_prompt_path = config.get("prompt_file", "")
         self._prompt_template = self._load_prompt(self._bundled_prompt_path)
+        self._prompt_parts = _split_template(self._prompt_template)
         self._user_prompt_path = None  # Set by ensure_user_prompt()
+        self._user_prompt_parts = self._prompt_parts
+        self._user_prompt_stamp = None  # (mtime_ns, size) of the cached file
         self._client = None
+        self._http = None
 
         # Translation prompt paths (resolved in _load_prompt)
         self._translate_prompts = {}
@@ -23,20 +97,36 @@ class Formatter:
         for key, filename in [("ja_en", "translate_ja_en.txt"), ("en_ja", "translate_en_ja.txt")]:
             path = os.path.join(project_root, "prompts", filename)
             if os.path.exists(path):
-                self._translate_prompts[key] = self._load_prompt(path)
+                self._translate_prompts[key] = _split_template(self._load_prompt(path))
 
     def _get_client(self):
         """Get or create an Ollama client with timeout."""
         if self._client is None:
-            import ollama
             self._client = ollama.Client(timeout=self.timeout)
         return self._client
 
+    def _get_http(self):
+        """Get or create a keep-alive HTTP client for Ollama status probes."""
+        if self._http is None:
+            self._http = httpx.Client(
+                base_url="http://localhost:11434",
+                timeout=2.0,
+                limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+            )
+        return self._http
+
+    def close(self) -> None:
+        """Close the keep-alive connection used for status probes."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
     def _fetch_tags(self) -> list | None:
         """Fetch model list from Ollama. Returns None if unreachable."""
+        if httpx is None:
+            return None
         try:
-            import httpx
-            r = httpx.get("http://localhost:11434/api/tags", timeout=2.0)
+            r = self._get_http().get("/api/tags")
             if r.status_code == 200:
                 return r.json().get("models", [])
         except Exception:
@@ -67,30 +157,24 @@ class Formatter:
 
     def _has_model(self, models: list) -> bool:
         """Check if the configured model exists in the model list."""
-        return any(
-            m.get("name", "") == self.model
-            or m.get("name", "").startswith(self.model + "-")
-            for m in models
-        )
+        names = {m.get("name", "") for m in models}
+        if self.model in names:
+            return True
+        prefix = self.model + "-"
+        return any(name.startswith(prefix) for name in names)
 
     def _load_prompt(self, path: str) -> str:
         """Load the formatting prompt template."""
         if path and os.path.exists(path):
             with open(path, "r", encoding="utf-8") as f:
                 return f.read()
-        # Fallback inline prompt
-        return (
-            "音声認識テキストを自然な書き言葉に整形してください。"
-            "フィラーを除去し、句読点を追加してください。"
-            "整形結果のみを出力してください。\n\n"
-            "入力テキスト:\n{text}"
-        )
+        return _FALLBACK_PROMPT
 
     def ensure_user_prompt(self, user_prompt_path: str) -> str:
         """Ensure user prompt file exists; copy bundled template if not.
 
         Returns the path to the user prompt file. Subsequent format() calls
-        will always re-read from this file so edits take effect immediately.
+        re-read this file whenever it changes, so edits take effect immediately.
         """
         if not os.path.exists(user_prompt_path):
             os.makedirs(os.path.dirname(user_prompt_path), exist_ok=True)
@@ -100,8 +184,22 @@ class Formatter:
                 with open(user_prompt_path, "w", encoding="utf-8") as f:
                     f.write(self._prompt_template)
         self._user_prompt_path = user_prompt_path
+        self._user_prompt_stamp = None
         return user_prompt_path
 
+    def _get_user_prompt_parts(self) -> tuple[str, str]:
+        """Return the split user prompt, re-reading it only if it changed."""
+        path = self._user_prompt_path
+        try:
+            st = os.stat(path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        if stamp is None or stamp != self._user_prompt_stamp:
+            self._user_prompt_parts = _split_template(self._load_prompt(path))
+            self._user_prompt_stamp = stamp
+        return self._user_prompt_parts
+
     def format(self, text: str, mode: str = "format") -> str:
         """Format or translate transcribed text using the local LLM.
 
@@ -109,37 +207,83 @@ class Formatter:
             text: Transcribed text to process.
             mode: "format", "translate_ja_en", or "translate_en_ja".
 
-        Falls back to raw text if Ollama is unavailable.
+        Falls back to raw text if Ollama is unavailable or fails.
         """
-        if not text.strip():
+        try:
+            return "".join(self.format_stream(text, mode=mode))
+        except FormatStreamError:
             return text
 
+    def format_stream(self, text: str, mode: str = "format"):
+        """Like format(), but yield the result in sentence-sized pieces.
+
+        Pieces are yielded as soon as the LLM has produced a sentence
+        terminator, so callers can start injecting before generation ends.
+        Joined, the pieces equal what format() returns. Yields the raw text
+        if Ollama is unavailable or fails before producing any output;
+        raises FormatStreamError if it fails after some pieces were yielded.
+        """
+        if not text.strip():
+            yield text
+            return
+        if ollama is None:
+            print("[Formatter] ollama package not installed, skipping formatting")
+            yield text
+            return
+        if mode == "format" and self.skip_clean and _needs_no_formatting(text):
+            yield text.strip()
+            return
+
+        emitted = False
+        buf = ""
         try:
             if mode in ("translate_ja_en", "translate_en_ja"):
                 key = mode.replace("translate_", "")
-                template = self._translate_prompts.get(key, self._prompt_template)
+                prefix, suffix = self._translate_prompts.get(key, self._prompt_parts)
             elif self._user_prompt_path:
-                template = self._load_prompt(self._user_prompt_path)
+                prefix, suffix = self._get_user_prompt_parts()
             else:
-                template = self._prompt_template
-            prompt = template.replace("{text}", text)
+                prefix, suffix = self._prompt_parts
+            prompt = prefix + text + suffix
             client = self._get_client()
 
-            response = client.chat(
+            stream = client.chat(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 options={"temperature": 0.3, "num_predict": 1024},
+                stream=True,
             )
 
-            result = response["message"]["content"].strip()
-            return result if result else text
+            for chunk in stream:
+                buf += chunk["message"]["content"]
+                cut = _sentence_cut(buf)
+                if cut:
+                    piece, buf = buf[:cut], buf[cut:]
+                    if not emitted:
+                        piece = piece.lstrip()
+                    # Hold back trailing whitespace until more text follows,
+                    # so the joined result stays stripped like format()'s
+                    body = piece.rstrip()
+                    buf = piece[len(body):] + buf
+                    piece = body
+                    if piece:
+                        emitted = True
+                        yield piece
 
-        except ImportError:
-            print("[Formatter] ollama package not installed, skipping formatting")
-            return text
         except Exception as e:
+            if emitted:
+                print(f"[Formatter] Ollama error mid-stream: {e}")
+                raise FormatStreamError(str(e)) from e
             print(f"[Formatter] Ollama error (using raw text): {e}")
-            return text
+            yield text
+            return
+
+        tail = buf.rstrip() if emitted else buf.strip()
+        if tail:
+            emitted = True
+            yield tail
+        if not emitted:
+            yield text
 
     @staticmethod
     def _find_ollama_bin() -> str:
@@ -164,19 +308,33 @@ class Formatter:
 
         ollama_bin = shutil.which("ollama") or self._find_ollama_bin()
 
-
         def _run():
             try:
                 proc = subprocess.Popen(
                     [ollama_bin, "pull", model_name],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
+                    bufsize=0,
                 )
-                for line in proc.stdout:
-                    line = line.strip()
-                    if line and on_progress:
-                        on_progress(line)
+                # Progress is redrawn with \r rather than \n, so read raw
+                # chunks and split on both instead of iterating lines
+                fd = proc.stdout.fileno()
+                decoder = codecs.getincrementaldecoder("utf-8")("replace")
+                buf = ""
+                while chunk := os.read(fd, 4096):
+                    buf += decoder.decode(chunk)
+                    cut = max(buf.rfind("\n"), buf.rfind("\r"))
+                    if cut < 0:
+                        continue
+                    done, buf = buf[:cut], buf[cut + 1:]
+                    if on_progress:
+                        # Only the newest line matters; earlier ones are stale
+                        for line in reversed(re.split(r"[\r\n]", done)):
+                            line = _ANSI_ESCAPE.sub("", line).strip()
+                            if line:
+                                on_progress(line)
+                                break
+                proc.stdout.close()
                 proc.wait()
                 if proc.returncode == 0:
                     if on_complete:
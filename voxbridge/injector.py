@@ -1,11 +1,13 @@
-"""Text injection into the active application via clipboard + CGEvent."""
+"""Text injection into the active application via CGEvent (typing or paste)."""
 
+import threading
 import time
 
 from AppKit import NSPasteboard, NSPasteboardTypeString, NSWorkspace
 from ApplicationServices import AXIsProcessTrusted
 from Quartz import (
     CGEventCreateKeyboardEvent,
+    CGEventKeyboardSetUnicodeString,
     CGEventPost,
     CGEventSetFlags,
     kCGEventFlagMaskCommand,
@@ -17,35 +19,73 @@ from Quartz import (
 _KEY_V = 0x09       # 'v'
 _KEY_RETURN = 0x24  # Return/Enter
 
+# CGEventKeyboardSetUnicodeString accepts at most 20 UTF-16 units per event
+_UNICODE_CHUNK = 20
+
 
 class Injector:
     """Injects text into the active application."""
 
     def __init__(self, config: dict):
-        self.send_enter_for = config.get(
+        self.send_enter_for = frozenset(config.get(
             "send_enter_for", ["Terminal", "iTerm2"]
-        )
+        ))
         self.enter_delay = config.get("enter_delay", 0.15)
         self.clipboard_restore_delay = config.get("clipboard_restore_delay", 0.3)
-
-    def inject(self, text: str) -> bool:
-        """Inject text into the active application via paste.
-
-        Returns True if text was injected (Cmd+V), False if only copied
-        to clipboard (Accessibility permission missing).
+        # "paste": put it on the clipboard and send Cmd+V
+        # "type": post the text as Unicode key events (clipboard untouched)
+        self.method = config.get("method", "paste")
+        # Pending clipboard restore after a paste and what it will restore.
+        # _restore_gen is bumped on every paste so a restore that already
+        # started firing for an older paste does nothing; both are
+        # guarded by _clipboard_lock.
+        self._clipboard_lock = threading.Lock()
+        self._restore_gen = 0
+        self._restore_pending = False
+        self._saved_clipboard: str | None = None
+        self._pb = NSPasteboard.generalPasteboard()
+        self._workspace = NSWorkspace.sharedWorkspace()
+
+    def inject(self, text: str, press_enter: bool = True) -> bool:
+        """Inject text into the active application.
+
+        Args:
+            text: Text to inject.
+            press_enter: Send Enter afterwards if the target is a terminal.
+                Pass False for all but the last piece of streamed text.
+
+        Returns True if text was injected (typed or Cmd+V), False if only
+        copied to clipboard (Accessibility permission missing).
         """
         trusted = AXIsProcessTrusted()
         active = self.get_active_app_name()
         print(f"[Injector] AXIsProcessTrusted={trusted}, target={active}")
 
-        pb = NSPasteboard.generalPasteboard()
-
-        # Save existing clipboard content
-        old_content = pb.stringForType_(NSPasteboardTypeString)
-
-        # Set new text
-        pb.clearContents()
-        pb.setString_forType_(text, NSPasteboardTypeString)
+        if trusted and self.can_type(text, active):
+            _type_unicode(text)
+            if press_enter:
+                self.press_enter_if_needed(active)
+            return True
+
+        pb = self._pb
+
+        # Save existing clipboard content. If a restore from the previous
+        # paste is still pending, the clipboard holds our own text: keep
+        # the user's original content instead. Bumping the generation
+        # under the lock makes that pending restore a no-op.
+        with self._clipboard_lock:
+            self._restore_gen += 1
+            gen = self._restore_gen
+            if self._restore_pending:
+                old_content = self._saved_clipboard
+            else:
+                old_content = pb.stringForType_(NSPasteboardTypeString)
+                self._saved_clipboard = old_content
+            self._restore_pending = True
+
+            # Set new text (declareTypes clears and takes ownership in one call)
+            pb.declareTypes_owner_([NSPasteboardTypeString], None)
+            pb.setString_forType_(text, NSPasteboardTypeString)
         time.sleep(0.05)
 
         # Verify clipboard was set
@@ -55,39 +95,92 @@ class Injector:
         if not trusted:
             # No Accessibility permission – leave text in clipboard for manual paste
             print("[Injector] Skipping CGEventPost (no Accessibility permission)")
+            with self._clipboard_lock:
+                if gen == self._restore_gen:
+                    self._restore_pending = False
+                    self._saved_clipboard = None
             return False
 
         # Paste via Cmd+V
         _send_keystroke(_KEY_V, flags=kCGEventFlagMaskCommand)
-        time.sleep(0.05)
 
-        # Send Enter if active app is a terminal
-        if self._should_send_enter():
+        # Enter and the clipboard restore only need to happen after the
+        # paste lands; schedule them instead of blocking the caller. The
+        # restore waits until after the Enter so the two never overlap.
+        restore_delay = self.clipboard_restore_delay
+        if press_enter and self._should_send_enter(active):
+            timer = threading.Timer(
+                self.enter_delay, _send_keystroke, args=(_KEY_RETURN,)
+            )
+            timer.daemon = True
+            timer.start()
+            restore_delay += self.enter_delay
+
+        restore = threading.Timer(
+            restore_delay, self._restore_clipboard, args=(gen,)
+        )
+        restore.daemon = True
+        restore.start()
+
+        return True
+
+    def _restore_clipboard(self, gen: int) -> None:
+        """Put the clipboard content saved before a paste back.
+
+        Skipped if another paste has happened since; that paste's own
+        restore puts the same content back later.
+        """
+        with self._clipboard_lock:
+            if gen != self._restore_gen:
+                return
+            self._restore_pending = False
+            content = self._saved_clipboard
+            self._saved_clipboard = None
+            if content:
+                self._pb.declareTypes_owner_([NSPasteboardTypeString], None)
+                self._pb.setString_forType_(content, NSPasteboardTypeString)
+            else:
+                self._pb.clearContents()
+
+    def press_enter_if_needed(self, app_name: str | None = None) -> None:
+        """Send Enter (after enter_delay) if the active app is a terminal.
+
+        Pass app_name if the frontmost app was already looked up.
+        """
+        if app_name is None:
+            app_name = self.get_active_app_name()
+        if self._should_send_enter(app_name):
             time.sleep(self.enter_delay)
             _send_keystroke(_KEY_RETURN)
 
-        # Restore previous clipboard
-        time.sleep(self.clipboard_restore_delay)
-        pb.clearContents()
-        if old_content:
-            pb.setString_forType_(old_content, NSPasteboardTypeString)
+    def can_stream(self, app_name: str) -> bool:
+        """Return True if text can be injected piece by piece into app_name.
 
-        return True
+        Only direct typing qualifies: pasting pieces would churn the
+        clipboard and race the previous paste, and without Accessibility
+        only the last piece would be left on it. Terminals always get
+        pasted, so they never stream.
+        """
+        return (self.method == "type" and not self._should_send_enter(app_name)
+                and bool(AXIsProcessTrusted()))
 
-    def _should_send_enter(self) -> bool:
-        """Check if the active application is a terminal that should receive Enter."""
-        try:
-            active_app = NSWorkspace.sharedWorkspace().frontmostApplication()
-            app_name = active_app.localizedName()
-            return app_name in self.send_enter_for
-        except Exception:
-            return False
+    def can_type(self, text: str, app_name: str) -> bool:
+        """Whether text can be typed as key events rather than pasted.
+
+        A typed newline acts as Return, which would run or send partial
+        lines in terminals and chat apps; bracketed paste does not.
+        """
+        return (self.method == "type" and "\n" not in text
+                and "\r" not in text and not self._should_send_enter(app_name))
 
-    @staticmethod
-    def get_active_app_name() -> str:
+    def _should_send_enter(self, app_name: str) -> bool:
+        """Check if the given app is a terminal that should receive Enter."""
+        return app_name in self.send_enter_for
+
+    def get_active_app_name(self) -> str:
         """Return the name of the frontmost application."""
         try:
-            active_app = NSWorkspace.sharedWorkspace().frontmostApplication()
+            active_app = self._workspace.frontmostApplication()
             return active_app.localizedName() or ""
         except Exception:
             return ""
@@ -104,3 +197,23 @@ def _send_keystroke(key_code: int, flags: int = 0) -> None:
 
     CGEventPost(kCGHIDEventTap, event_down)
     CGEventPost(kCGHIDEventTap, event_up)
+
+
+def _type_unicode(text: str) -> None:
+    """Type text as Unicode keyboard events, without using the clipboard."""
+    units = text.encode("utf-16-le")
+    total = len(units) // 2
+    start = 0
+    while start < total:
+        end = min(start + _UNICODE_CHUNK, total)
+        # Don't split a surrogate pair across two events
+        last = int.from_bytes(units[2 * end - 2:2 * end], "little")
+        if end < total and 0xD800 <= last <= 0xDBFF:
+            end -= 1
+        chunk = units[2 * start:2 * end].decode("utf-16-le")
+        for key_down in (True, False):
+            event = CGEventCreateKeyboardEvent(None, 0, key_down)
+            CGEventSetFlags(event, 0)  # ignore any modifier still held
+            CGEventKeyboardSetUnicodeString(event, end - start, chunk)
+            CGEventPost(kCGHIDEventTap, event)
+        start = end
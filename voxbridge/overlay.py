@@ -12,13 +12,16 @@ from AppKit import (
     NSStatusBar,
     NSTextField,
     NSVariableStatusItemLength,
+    NSView,
     NSWindowStyleMaskBorderless,
 )
 from Foundation import NSObject
 import objc
+from PyObjCTools import AppHelper
 
 from AppKit import NSBundle
 
+from . import __version__
 from .constants import (
     FORMAT_LEVELS,
     FORMAT_LEVEL_LABELS,
@@ -38,17 +41,45 @@ def _get_version() -> str:
             version = info.get("CFBundleShortVersionString")
             if version:
                 return version
-    from . import __version__
     return __version__
 
 # NSPanel style: borderless + non-activating (shows without stealing focus)
 _PANEL_STYLE = NSWindowStyleMaskBorderless | NS_NON_ACTIVATING_PANEL_MASK
 
+# Background RGBA per overlay state
+_BG_COLORS = {
+    "recording": (0.6, 0.1, 0.1, 0.92),
+    "success": (0.1, 0.4, 0.1, 0.92),
+    "warning": (0.6, 0.5, 0.0, 0.92),
+    "error": (0.6, 0.2, 0.0, 0.92),
+    "default": (0.1, 0.1, 0.1, 0.92),
+}
+
+_label_font_cache = None
+
+
+def _label_font():
+    """Monospaced overlay font, resolved once per process."""
+    global _label_font_cache
+    if _label_font_cache is None:
+        _label_font_cache = NSFont.monospacedSystemFontOfSize_weight_(12.5, 0.0)
+    return _label_font_cache
+
+
+class _LayerContentView(NSView):
+    """Content view drawn purely by its layer (no drawRect: pass)."""
+
+    def wantsUpdateLayer(self):
+        return True
+
+    def updateLayer(self):
+        pass
+
 
 class Overlay(NSObject):
     """Small floating overlay window showing status text (bottom-right).
 
-    Inherits NSObject so that NSTimer selectors work correctly.
+    Inherits NSObject so that delayed performSelector calls work correctly.
     """
 
     @classmethod
@@ -61,6 +92,9 @@ class Overlay(NSObject):
 
     @objc.python_method
     def _setup(self, config: dict):
+        # Panel, layer and label are built on first show()
+        self._window = None
+        self._visible = False
         self._enabled = config.get("enabled", True)
         if not self._enabled:
             return
@@ -70,9 +104,21 @@ class Overlay(NSObject):
         self._line_height = 18  # Approximate line height for 12.5pt monospace
         self._max_lines = 6
         self._margin = config.get("margin", 20)
-        opacity = config.get("opacity", 0.88)
+        self._opacity = config.get("opacity", 0.88)
         self._auto_hide_delay = config.get("auto_hide_delay", 2.0)
 
+    @objc.python_method
+    def _ensure_window(self) -> None:
+        """Create the panel and its label once, on first use."""
+        if self._window is not None:
+            return
+
+        # CGColor per state, built once instead of on every show()
+        self._cg_colors = {
+            name: NSColor.colorWithRed_green_blue_alpha_(*rgba).CGColor()
+            for name, rgba in _BG_COLORS.items()
+        }
+
         # Position: bottom-right of main screen
         screen = NSScreen.mainScreen().visibleFrame()
         self._screen_frame = screen
@@ -88,20 +134,26 @@ class Overlay(NSObject):
         )
         self._window.setFloatingPanel_(True)
         self._window.setHidesOnDeactivate_(False)
-        self._window.setAlphaValue_(opacity)
+        self._window.setAlphaValue_(self._opacity)
         self._window.setOpaque_(False)
-        self._window.setBackgroundColor_(
-            NSColor.colorWithRed_green_blue_alpha_(0.1, 0.1, 0.1, 0.92)
-        )
+        self._window.setBackgroundColor_(NSColor.clearColor())
         self._window.setHasShadow_(True)
         self._window.setIgnoresMouseEvents_(True)
         self._window.setCollectionBehavior_(NS_WINDOW_CAN_JOIN_ALL_SPACES)
 
-        # Rounded corners
-        content_view = self._window.contentView()
+        # Layer-backed content view with rounded corners; background lives on the layer
+        content_view = _LayerContentView.alloc().initWithFrame_(
+            NSMakeRect(0, 0, self._width, self._min_height)
+        )
         content_view.setWantsLayer_(True)
-        content_view.layer().setCornerRadius_(8)
-        content_view.layer().setMasksToBounds_(True)
+        self._layer = content_view.layer()
+        self._layer.setCornerRadius_(8)
+        self._layer.setMasksToBounds_(True)
+        self._layer.setBackgroundColor_(self._cg_colors["default"])
+        self._window.setContentView_(content_view)
+        self._current_color = "default"
+        self._last_text = None
+        self._frame = None
 
         # Status label (multi-line capable)
         self._label = NSTextField.alloc().initWithFrame_(
@@ -109,18 +161,17 @@ class Overlay(NSObject):
         )
         self._label.setStringValue_("")
         self._label.setTextColor_(NSColor.whiteColor())
-        self._label.setFont_(NSFont.monospacedSystemFontOfSize_weight_(12.5, 0.0))
+        self._label.setFont_(_label_font())
         self._label.setDrawsBackground_(False)
         self._label.setBezeled_(False)
         self._label.setEditable_(False)
         self._label.setSelectable_(False)
         self._label.setMaximumNumberOfLines_(0)  # Unlimited — trimming handled in show()
-        self._label.cell().setWraps_(True)
-        self._label.cell().setLineBreakMode_(0)  # NSLineBreakByWordWrapping
+        cell = self._label.cell()
+        cell.setWraps_(True)
+        cell.setLineBreakMode_(0)  # NSLineBreakByWordWrapping
         content_view.addSubview_(self._label)
 
-        self._window.orderOut_(None)  # Start hidden
-
     @objc.python_method
     def _measure_text_height(self) -> int:
         """Measure actual rendered text height via NSTextField's cell."""
@@ -159,10 +210,13 @@ class Overlay(NSObject):
         """Show overlay with status text. Must be called on main thread."""
         if not self._enabled:
             return
+        self._ensure_window()
 
-        # Trim long text to show latest lines only
-        display_text = self._trim_to_max_lines(text)
-        self._label.setStringValue_(display_text)
+        # Trim long text to show latest lines only (label already holds it if unchanged)
+        if text != self._last_text:
+            display_text = self._trim_to_max_lines(text)
+            self._label.setStringValue_(display_text)
+            self._last_text = text
 
         # Resize window height based on actual text rendering
         # Use current screen (follows mouse cursor) instead of cached screen
@@ -171,25 +225,27 @@ class Overlay(NSObject):
         new_height = max(self._min_height, 12 + text_height)
         x = screen.origin.x + screen.size.width - self._width - self._margin
         y = screen.origin.y + self._margin
-        self._window.setFrame_display_(
-            NSMakeRect(x, y, self._width, new_height), True
-        )
-        self._label.setFrame_(NSMakeRect(12, 6, self._width - 24, new_height - 12))
+        # Only move/resize when the frame changes; AppKit redraws on its next pass
+        frame = (x, y, new_height)
+        if frame != self._frame:
+            self._window.setFrame_display_(
+                NSMakeRect(x, y, self._width, new_height), False
+            )
+            self._label.setFrame_(
+                NSMakeRect(12, 6, self._width - 24, new_height - 12)
+            )
+            self._frame = frame
 
         # Change background color based on state
-        colors = {
-            "recording": (0.6, 0.1, 0.1, 0.92),
-            "success": (0.1, 0.4, 0.1, 0.92),
-            "warning": (0.6, 0.5, 0.0, 0.92),
-            "error": (0.6, 0.2, 0.0, 0.92),
-            "default": (0.1, 0.1, 0.1, 0.92),
-        }
-        r, g, b, a = colors.get(color, colors["default"])
-        self._window.setBackgroundColor_(
-            NSColor.colorWithRed_green_blue_alpha_(r, g, b, a)
-        )
+        if color not in self._cg_colors:
+            color = "default"
+        if color != self._current_color:
+            self._layer.setBackgroundColor_(self._cg_colors[color])
+            self._current_color = color
 
-        self._window.orderFrontRegardless()
+        if not self._visible:
+            self._window.orderFrontRegardless()
+            self._visible = True
 
         # Cancel any pending auto-hide
         NSObject.cancelPreviousPerformRequestsWithTarget_selector_object_(
@@ -204,12 +260,13 @@ class Overlay(NSObject):
     @objc.python_method
     def hide(self) -> None:
         """Hide overlay. Must be called on main thread."""
-        if not self._enabled:
+        if not self._visible:
             return
         self._window.orderOut_(None)
+        self._visible = False
 
-    def hideOverlay_(self, timer) -> None:
-        """Timer callback to hide overlay."""
+    def hideOverlay_(self, _sender) -> None:
+        """Delayed-perform callback to hide overlay."""
         self.hide()
 
 
@@ -262,7 +319,6 @@ class StatusBarItem(NSObject):
         )
         # Set title via button API (modern macOS) and direct API (fallback)
         button = self._item.button()
-        print(f"[StatusBar] button={button}, item={self._item}")
         if button:
             button.setTitle_("VB")
         self._item.setTitle_("VB")
@@ -278,71 +334,23 @@ class StatusBarItem(NSObject):
 
         menu.addItem_(NSMenuItem.separatorItem())
 
-        # Hotkey submenu
-        hotkey_menu = NSMenu.alloc().init()
-        self._hotkey_items = {}
-        for key, label in HOTKEY_LABELS.items():
-            item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                label, "hotkeySelected:", ""
-            )
-            item.setTarget_(self)
-            item.setRepresentedObject_(key)
-            if key == current_hotkey:
-                item.setState_(1)  # NSOnState
-            hotkey_menu.addItem_(item)
-            self._hotkey_items[key] = item
-
-        hotkey_parent = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Hotkey", None, ""
+        # Hotkey / model / formatting submenus
+        self._hotkey_items = self._add_submenu(
+            menu, "Hotkey", HOTKEY_LABELS, "hotkeySelected:", current_hotkey
         )
-        hotkey_parent.setSubmenu_(hotkey_menu)
-        menu.addItem_(hotkey_parent)
-
-        # Model submenu
-        model_menu = NSMenu.alloc().init()
-        self._model_items = {}
-        for model_name in STT_MODELS:
-            item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                model_name, "modelSelected:", ""
-            )
-            item.setTarget_(self)
-            item.setRepresentedObject_(model_name)
-            if model_name == current_model:
-                item.setState_(1)
-            model_menu.addItem_(item)
-            self._model_items[model_name] = item
-
-        model_parent = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Speech Model", None, ""
+        self._model_items = self._add_submenu(
+            menu, "Speech Model", {m: m for m in STT_MODELS}, "modelSelected:",
+            current_model,
         )
-        model_parent.setSubmenu_(model_menu)
-        menu.addItem_(model_parent)
-
-        # Formatting submenu
-        format_menu = NSMenu.alloc().init()
-        format_menu.setAutoenablesItems_(False)
-        self._format_items = {}
+        # Disable options requiring Ollama when not available
         formatter_ready = ollama_available and model_available
-        for level in FORMAT_LEVELS:
-            label = FORMAT_LEVEL_LABELS[level]
-            item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                label, "formatLevelSelected:", ""
-            )
-            item.setTarget_(self)
-            item.setRepresentedObject_(level)
-            if level == current_format_level:
-                item.setState_(1)
-            # Disable options requiring Ollama when not available
-            if level != "off" and not formatter_ready:
-                item.setEnabled_(False)
-            format_menu.addItem_(item)
-            self._format_items[level] = item
-
-        format_parent = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Formatting", None, ""
+        self._last_formatter_ready = formatter_ready
+        self._format_items = self._add_submenu(
+            menu, "Formatting",
+            {level: FORMAT_LEVEL_LABELS[level] for level in FORMAT_LEVELS},
+            "formatLevelSelected:", current_format_level,
+            disabled=lambda level: level != "off" and not formatter_ready,
         )
-        format_parent.setSubmenu_(format_menu)
-        menu.addItem_(format_parent)
 
         menu.addItem_(NSMenuItem.separatorItem())
 
@@ -387,15 +395,42 @@ class StatusBarItem(NSObject):
         menu.addItem_(quit_item)
 
         self._item.setMenu_(menu)
-        print(f"[StatusBar] Menu bar item created with title='VB'")
+        print("[StatusBar] Menu bar item created with title='VB'")
+
+    @objc.python_method
+    def _add_submenu(self, menu, title, labels, action, current, disabled=None):
+        """Append a titled submenu of checkable items; return {key: item}."""
+        submenu = NSMenu.alloc().init()
+        if disabled is not None:
+            submenu.setAutoenablesItems_(False)
+        items = {}
+        for key, label in labels.items():
+            item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+                label, action, ""
+            )
+            item.setTarget_(self)
+            item.setRepresentedObject_(key)
+            if key == current:
+                item.setState_(1)  # NSOnState
+            if disabled is not None and disabled(key):
+                item.setEnabled_(False)
+            submenu.addItem_(item)
+            items[key] = item
+
+        parent = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+            title, None, ""
+        )
+        parent.setSubmenu_(submenu)
+        menu.addItem_(parent)
+        return items
 
     def hotkeySelected_(self, sender):
         """Menu callback when a hotkey option is selected."""
         key = sender.representedObject()
         if key == self._current_hotkey:
             return
-        for k, item in self._hotkey_items.items():
-            item.setState_(1 if k == key else 0)
+        self._uncheck(self._hotkey_items, self._current_hotkey)
+        sender.setState_(1)
         self._current_hotkey = key
         if self._on_hotkey_change:
             self._on_hotkey_change(key)
@@ -405,8 +440,8 @@ class StatusBarItem(NSObject):
         model_name = sender.representedObject()
         if model_name == self._current_model:
             return
-        for m, item in self._model_items.items():
-            item.setState_(1 if m == model_name else 0)
+        self._uncheck(self._model_items, self._current_model)
+        sender.setState_(1)
         self._current_model = model_name
         if self._on_model_change:
             self._on_model_change(model_name)
@@ -416,8 +451,8 @@ class StatusBarItem(NSObject):
         level = sender.representedObject()
         if level == self._current_format_level:
             return
-        for lv, item in self._format_items.items():
-            item.setState_(1 if lv == level else 0)
+        self._uncheck(self._format_items, self._current_format_level)
+        sender.setState_(1)
         self._current_format_level = level
         if self._on_format_level_change:
             self._on_format_level_change(level)
@@ -444,6 +479,13 @@ class StatusBarItem(NSObject):
         if self._on_launch_at_login_change:
             self._on_launch_at_login_change(new_state)
 
+    @objc.python_method
+    def _uncheck(self, items: dict, key) -> None:
+        """Clear the checkmark on the previously selected item only."""
+        item = items.get(key)
+        if item is not None:
+            item.setState_(0)
+
     @objc.python_method
     def set_title(self, title: str) -> None:
         self._item.setTitle_(title)
@@ -472,20 +514,22 @@ class StatusBarItem(NSObject):
         ollama_present = self._install_ollama_item.isHidden()
         model_present = self._download_model_item.isHidden()
         formatter_ready = ollama_present and model_present
-        # Enable/disable all options that require Ollama
-        for level, item in self._format_items.items():
-            if level != "off":
-                item.setEnabled_(formatter_ready)
+        # Enable/disable all options that require Ollama (only on change)
+        if formatter_ready != self._last_formatter_ready:
+            self._last_formatter_ready = formatter_ready
+            for level, item in self._format_items.items():
+                if level != "off":
+                    item.setEnabled_(formatter_ready)
         # Auto-switch to Off if current selection requires Ollama but unavailable
         if not formatter_ready and self._current_format_level != "off":
-            for item in self._format_items.values():
-                item.setState_(0)
+            self._uncheck(self._format_items, self._current_format_level)
             off_item = self._format_items.get("off")
             if off_item:
                 off_item.setState_(1)
             self._current_format_level = "off"
             if self._on_format_level_change:
-                self._on_format_level_change("off")
+                # Deferred so the availability setter returns before the app reacts
+                AppHelper.callAfter(self._on_format_level_change, "off")
 
     @objc.python_method
     def set_download_in_progress(self, in_progress: bool) -> None:
@@ -14,21 +14,40 @@ _LAUNCH_AT_LOGIN_FILE = os.path.join(_SUPPORT_DIR, "launch_at_login")
 
 USER_PROMPT_FILE = os.path.join(_SUPPORT_DIR, "format_prompt.txt")
 
+# In-memory copy of preference values: read on first use, updated on write
+_cache: dict[str, str | None] = {}
+
 
 def _read(path: str) -> str | None:
     """Read a single-value preference file. Returns None if missing."""
+    if path in _cache:
+        return _cache[path]
+    # Values are a few bytes of ASCII: one raw read, no text I/O stack
     try:
-        with open(path, "r") as f:
-            return f.read().strip() or None
+        fd = os.open(path, os.O_RDONLY)
     except FileNotFoundError:
-        return None
+        value = None
+    else:
+        try:
+            value = os.read(fd, 256).decode().strip() or None
+        finally:
+            os.close(fd)
+    _cache[path] = value
+    return value
 
 
 def _write(path: str, value: str) -> None:
-    """Write a single-value preference file."""
+    """Write a single-value preference file.
+
+    Writes to a temp file and renames it over the target, so a crash
+    mid-write never leaves a truncated preference behind.
+    """
     os.makedirs(_SUPPORT_DIR, exist_ok=True)
-    with open(path, "w") as f:
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
         f.write(value)
+    os.replace(tmp, path)
+    _cache[path] = value.strip() or None
 
 
 def get_hotkey(default: str = "alt_r") -> str:
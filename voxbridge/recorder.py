@@ -7,18 +7,59 @@ import numpy as np
 import sounddevice as sd
 
 
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+# Default trim threshold: samples below -40 dBFS (1% of full scale)
+# count as silence. Overridable via recording.silence_dbfs.
+DEFAULT_SILENCE_DBFS = -40.0
+# Default RMS gate: clips whose speech span stays below it (e.g. a lone
+# click) are dropped. Overridable via recording.min_rms (0 disables).
+DEFAULT_MIN_RMS = 0.005
+
+
+def _to_float32(pcm: np.ndarray) -> np.ndarray:
+    """Convert int16 PCM to float32 in [-1, 1) in a single pass."""
+    return np.multiply(pcm, _INT16_SCALE, dtype=np.float32)
+
+
+def _dbfs_to_int16(dbfs: float) -> int:
+    """Convert a dBFS level to an int16 sample amplitude."""
+    return int(32768 * 10 ** (dbfs / 20))
+
+
+def _speech_bounds(pcm: np.ndarray, pad: int, level: int) -> tuple[int, int]:
+    """Return [start, end) of the span louder than `level`, widened by `pad`."""
+    loud = (pcm > level) | (pcm < -level)
+    if not loud.any():
+        return 0, 0
+    first = int(np.argmax(loud))
+    last = pcm.size - int(np.argmax(loud[::-1]))
+    return max(0, first - pad), min(pcm.size, last + pad)
+
+
 class Recorder:
     """Records audio from the default microphone."""
 
     def __init__(self, sample_rate: int = 16000, max_duration: int = 60,
-                 on_max_reached=None):
+                 on_max_reached=None,
+                 silence_dbfs: float = DEFAULT_SILENCE_DBFS,
+                 min_rms: float = DEFAULT_MIN_RMS):
         self.sample_rate = sample_rate
         self.max_duration = max_duration
         self._on_max_reached = on_max_reached
-        self._frames: list[np.ndarray] = []
+        self._silence_level = _dbfs_to_int16(silence_dbfs)
+        self._min_rms = min_rms
+        # Pre-allocated mono buffer for the whole max duration; the audio
+        # callback copies each block straight into it. Captured as int16
+        # (the mic's native format, half the bandwidth of float32) and
+        # converted to float32 once when the audio is handed out.
+        self._buf = np.empty(sample_rate * max_duration, dtype=np.int16)
+        self._wpos = 0
+        # Sample index where speech ended in the last stopped recording
+        self.speech_end = 0
+        # True if the last stopped recording was dropped as silent/too quiet
+        self.no_speech = False
         self._stream: sd.InputStream | None = None
         self._lock = threading.Lock()
-        self._max_timer: threading.Timer | None = None
         self._start_time: float | None = None
 
     def get_elapsed(self) -> float:
@@ -30,60 +71,72 @@ class Recorder:
     def start(self) -> None:
         """Start recording audio."""
         with self._lock:
-            self._frames = []
+            self._wpos = 0
             self._start_time = time.time()
             self._stream = sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=1,
-                dtype="float32",
+                dtype="int16",
                 callback=self._audio_callback,
             )
             self._stream.start()
 
-            # Auto-stop after max_duration
-            self._max_timer = threading.Timer(
-                self.max_duration, self._on_max_duration
-            )
-            self._max_timer.daemon = True
-            self._max_timer.start()
+    def stop(self, trim_silence: bool = True) -> np.ndarray:
+        """Stop recording and return audio as numpy array (float32, mono, 16kHz).
 
-    def stop(self) -> np.ndarray | None:
-        """Stop recording and return audio as numpy array (float32, mono, 16kHz)."""
+        Leading/trailing silence is trimmed (with 0.1s margin) so the
+        encoder only sees speech. Returns an empty array (and sets
+        no_speech) if nothing audible was captured.
+        """
         with self._lock:
-            if self._max_timer:
-                self._max_timer.cancel()
-                self._max_timer = None
-
             if self._stream is not None:
                 self._stream.stop()
                 self._stream.close()
                 self._stream = None
 
-            if not self._frames:
-                return None
-
-            audio = np.concatenate(self._frames, axis=0).flatten()
-            self._frames = []
+            start, end = 0, self._wpos
+            if trim_silence:
+                start, end = _speech_bounds(
+                    self._buf[:self._wpos], self.sample_rate // 10,
+                    self._silence_level,
+                )
+            self.speech_end = end
+            audio = _to_float32(self._buf[start:end])
+            self.no_speech = trim_silence and self._wpos > 0 and (
+                audio.size == 0
+                # Mean square via one dot product, no squared temporary
+                or float(np.dot(audio, audio))
+                < self._min_rms * self._min_rms * audio.size
+            )
+            if self.no_speech:
+                return audio[:0]
             return audio
 
-    def get_audio_snapshot(self) -> np.ndarray | None:
+    def get_audio_snapshot(self) -> np.ndarray:
         """Return a copy of the current audio buffer without stopping recording."""
         with self._lock:
-            if not self._frames:
-                return None
-            return np.concatenate(self._frames, axis=0).flatten()
+            return _to_float32(self._buf[:self._wpos])
 
     def _on_max_duration(self) -> None:
         """Called when max recording duration is reached."""
+        if self._stream is None:
+            return  # Already stopped by the user
         audio = self.stop()
         if self._on_max_reached:
             self._on_max_reached(audio)
 
     def _audio_callback(self, indata, frames, time_info, status):
-        """Sounddevice callback - collects audio frames."""
+        """Sounddevice callback - copies audio frames into the buffer."""
         if status:
             print(f"[Recorder] {status}")
-        self._frames.append(indata.copy())
+        n = min(frames, self._buf.size - self._wpos)
+        self._buf[self._wpos:self._wpos + n] = indata[:n, 0]
+        self._wpos += n
+        # Buffer full = max_duration reached: end the stream and hand the
+        # audio off on another thread (stop() can't run inside the callback)
+        if self._wpos >= self._buf.size:
+            threading.Thread(target=self._on_max_duration, daemon=True).start()
+            raise sd.CallbackStop
 
     @property
     def is_recording(self) -> bool:
@@ -1,10 +1,84 @@
 """Speech-to-Text using faster-whisper (local, offline)."""
 
 import os
+import platform
+import subprocess
+import threading
 
+import ctranslate2
 import numpy as np
 from faster_whisper import WhisperModel
 
+# Models that stay faster than real time on a 4-thread CPU
+_SMALL_MODELS = ("tiny", "base")
+
+
+def is_model_cached(model_name: str) -> bool:
+    """Check if a Whisper model is already downloaded locally.
+
+    Only probes the Hugging Face cache directory, so it can be called
+    without constructing an STT instance.
+    """
+    cache_dir = os.path.join(
+        os.path.expanduser("~"), ".cache", "huggingface", "hub"
+    )
+    # faster-whisper models are stored under "models--Systran--faster-whisper-<model>"
+    return os.path.isdir(
+        os.path.join(cache_dir, f"models--Systran--faster-whisper-{model_name}")
+    )
+
+
+def _sysctl(name: str) -> str:
+    """Read a macOS sysctl value ("" if unavailable)."""
+    try:
+        return subprocess.run(
+            ["sysctl", "-n", name],
+            capture_output=True, text=True, timeout=2,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def _has_vnni() -> bool:
+    """Whether an Intel Mac CPU has VNNI (fast int8 dot products)."""
+    return "VNNI" in _sysctl("machdep.cpu.leaf7_features").upper()
+
+
+def _physical_cores() -> int:
+    """Performance cores on Apple Silicon, physical cores elsewhere.
+
+    Hyperthreads and efficiency cores only slow CTranslate2's
+    synchronized GEMM threads down.
+    """
+    for name in ("hw.perflevel0.physicalcpu", "hw.physicalcpu"):
+        value = _sysctl(name)
+        if value.isdigit() and int(value) > 0:
+            return int(value)
+    return os.cpu_count() or 4
+
+
+def _auto_compute_type(device: str) -> str:
+    """Pick the fastest supported compute type for this machine.
+
+    int8 only pays off on CPUs with dedicated int8 dot-product
+    instructions (Apple Silicon, or VNNI on x86); older x86 CPUs use
+    int16 when CTranslate2 supports it.
+    """
+    try:
+        supported = ctranslate2.get_supported_compute_types(device)
+    except (RuntimeError, ValueError):
+        return "default"
+    if device == "cuda":
+        preferred = ("int8_float16", "float16")
+    elif platform.machine() == "arm64" or _has_vnni():
+        preferred = ("int8", "int8_float32")
+    else:
+        preferred = ("int16", "int8")
+    for compute_type in preferred:
+        if compute_type in supported:
+            return compute_type
+    return "default"
+
 
 class STT:
     """Transcribes audio using faster-whisper."""
@@ -12,39 +86,86 @@ class STT:
     def __init__(self, config: dict):
         self.model_name = config.get("model", "small")
         self.device = config.get("device", "cpu")
-        self.compute_type = config.get("compute_type", "int8")
+        self.compute_type = config.get("compute_type", "auto")
+        # One thread per physical (performance) core unless capped
+        cores = _physical_cores()
+        self.cpu_threads = min(cores, config.get("cpu_threads") or cores)
+        # Greedy decoding on CPU: beam search multiplies decoder work for
+        # little accuracy gain on short push-to-talk clips
+        self.beam_size = config.get("beam_size") or (1 if self.device == "cpu" else 5)
+        # Recorder already trims head/tail silence, so the Silero VAD pass
+        # can be turned off; when kept, only long pauses split segments
+        self.vad_filter = config.get("vad_filter", True)
+        self.vad_min_silence_ms = config.get("vad_min_silence_ms", 800)
+        # Optional vocabulary hint (names, jargon) fed to the decoder
+        self.initial_prompt = config.get("initial_prompt") or None
         self._model: WhisperModel | None = None
+        # Serializes loading: a transcribe during a background preload
+        # waits for that load instead of starting a second one
+        self._model_lock = threading.Lock()
 
     def _ensure_model(self) -> WhisperModel:
         """Lazy-load the Whisper model."""
-        if self._model is None:
-            print(f"[STT] Loading model: {self.model_name} (device={self.device}, compute={self.compute_type})")
-            self._model = WhisperModel(
-                self.model_name,
-                device=self.device,
-                compute_type=self.compute_type,
-            )
-            print("[STT] Model loaded.")
+        model = self._model
+        if model is not None:
+            return model
+        with self._model_lock:
+            if self._model is None:
+                if self.compute_type == "auto":
+                    self.compute_type = _auto_compute_type(self.device)
+                print(f"[STT] Loading model: {self.model_name} (device={self.device}, compute={self.compute_type})")
+                if (self.device == "cpu" and self.cpu_threads <= 4
+                        and self.model_name not in _SMALL_MODELS):
+                    print(f"[STT] {self.cpu_threads} CPU threads: '{self.model_name}' "
+                          "may be slower than real time; 'base' or 'tiny' is faster")
+                # Skip the Hugging Face revision check when already downloaded
+                local_only = self.is_model_cached()
+                try:
+                    self._model = self._load_model(local_only)
+                except Exception as e:
+                    if not local_only:
+                        raise
+                    # Cache dir exists but the download is incomplete: resume it
+                    print(f"[STT] Cached model unusable ({e}); retrying with download")
+                    self._model = self._load_model(False)
+                print("[STT] Model loaded.")
         return self._model
 
+    def _load_model(self, local_files_only: bool) -> WhisperModel:
+        return WhisperModel(
+            self.model_name,
+            device=self.device,
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
+            num_workers=1,
+            local_files_only=local_files_only,
+        )
+
     def is_model_cached(self) -> bool:
         """Check if the Whisper model is already downloaded locally."""
-        cache_dir = os.path.join(
-            os.path.expanduser("~"), ".cache", "huggingface", "hub"
-        )
-        if not os.path.isdir(cache_dir):
-            return False
-        # faster-whisper models are stored under "models--Systran--faster-whisper-<model>"
-        expected_prefix = f"models--Systran--faster-whisper-{self.model_name}"
-        for entry in os.listdir(cache_dir):
-            if entry == expected_prefix:
-                return True
-        return False
+        return is_model_cached(self.model_name)
 
     def preload(self) -> None:
         """Eagerly load the Whisper model (called with --preload)."""
         self._ensure_model()
 
+    def warmup(self) -> None:
+        """Run one tiny decode so lazily initialized kernels are ready.
+
+        VAD is disabled here: on silent input it would drop every chunk
+        and the decoder would never run.
+        """
+        model = self._ensure_model()
+        segments, _ = model.transcribe(
+            np.zeros(1600, dtype=np.float32),
+            language="en",
+            beam_size=1,
+            vad_filter=False,
+            without_timestamps=True,
+        )
+        for _ in segments:
+            pass
+
     def transcribe(self, audio: np.ndarray, language: str | None = None) -> str:
         """Transcribe audio numpy array to text.
 
@@ -56,17 +177,26 @@ class STT:
             Transcribed text string
         """
         model = self._ensure_model()
+        # No-op for Recorder output; only copies foreign int/strided input
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
 
         segments, info = model.transcribe(
             audio,
             language=language,
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters=dict(min_silence_duration_ms=500),
+            beam_size=self.beam_size,
+            best_of=self.beam_size,
+            vad_filter=self.vad_filter,
+            vad_parameters=(
+                dict(min_silence_duration_ms=self.vad_min_silence_ms)
+                if self.vad_filter else None
+            ),
+            without_timestamps=True,
+            condition_on_previous_text=False,
+            initial_prompt=self.initial_prompt,
         )
 
         if language is None:
             print(f"[STT] Detected language: {info.language} ({info.language_probability:.0%})")
 
-        text = "".join(segment.text for segment in segments)
-        return text.strip()
+        # str.join builds a list from a generator anyway; hand it one directly
+        return "".join([segment.text for segment in segments]).strip()